@@ -4,26 +4,59 @@ Agent management for Claude Code Manager.
 
 import json
 import uuid
-import subprocess
+import atexit
+import shutil
 import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple
 
-from .config import Config
+from .config import Config, atomic_write, file_signature, json_dumps
 from .models import Agent, AgentRun
 
 
 class AgentManager:
     """Manages custom Claude Code agents."""
 
+    MAX_RUNS = 100
+    # Upper bound on background claude processes running at once
+    MAX_CONCURRENT_RUNS = 4
+    # Rewrite the runs log once this many entries have been appended
+    COMPACT_AFTER_LINES = 500
+    # Seconds to wait before writing, so bursts of changes share one write
+    FLUSH_DELAY = 0.5
+
     def __init__(self, config: Config):
         self.config = config
         self.agents_file = config.claude_dir / "claude-code-manager-py" / "agents.json"
-        self.runs_file = config.claude_dir / "claude-code-manager-py" / "agent_runs.json"
+        self.runs_file = config.claude_dir / "claude-code-manager-py" / "agent_runs.jsonl"
+        self.legacy_runs_file = config.claude_dir / "claude-code-manager-py" / "agent_runs.json"
+        self.responses_dir = config.claude_dir / "claude-code-manager-py" / "runs"
         self._agents: Optional[List[Agent]] = None
+        # Position of each agent name in self._agents
+        self._agent_index: Dict[str, int] = {}
+        # (mtime_ns, size) of each file as of the last load or write
+        self._agents_signature: Optional[Tuple[int, int]] = None
+        self._runs_signature: Optional[Tuple[int, int]] = None
         self._runs: Optional[List[AgentRun]] = None
+        self._runs_by_id: Dict[str, AgentRun] = {}
+        self._runs_log_lines = 0
+        # Per-agent run aggregates, kept in step with self._runs
+        self._agent_stats: Dict[str, Dict[str, Any]] = {}
         self._running_processes: Dict[str, subprocess.Popen] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queued_runs: Set[str] = set()
+        self._cancelled_runs: Set[str] = set()
+        self._claude_executable: Optional[str] = None
+
+        # Pending writes, coalesced and written by flush()
+        self._dirty_agents = False
+        self._pending_run_lines: List[str] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.RLock()
+        atexit.register(self.flush)
 
     def _ensure_files_exist(self) -> None:
         """Ensure agent files exist."""
@@ -32,38 +65,85 @@ class AgentManager:
             with open(self.agents_file, 'w', encoding='utf-8') as f:
                 json.dump([], f)
         if not self.runs_file.exists():
-            with open(self.runs_file, 'w', encoding='utf-8') as f:
-                json.dump([], f)
+            self._migrate_legacy_runs()
+
+    def _migrate_legacy_runs(self) -> None:
+        """Convert the old agent_runs.json array into the JSONL log."""
+        records = []
+        if self.legacy_runs_file.exists():
+            try:
+                with open(self.legacy_runs_file, 'r', encoding='utf-8') as f:
+                    records = json.loads(f.read())
+            except (json.JSONDecodeError, IOError):
+                records = []
+
+        atomic_write(self.runs_file, ''.join(json.dumps(r, separators=(',', ':')) + '\n' for r in records))
 
     def get_agents(self, force_refresh: bool = False) -> List[Agent]:
         """Get all agents."""
         if self._agents is not None and not force_refresh:
             return self._agents
 
+        self.flush()
         self._ensure_files_exist()
 
+        # Skip the reparse if the file hasn't changed since we last saw it
+        signature = file_signature(self.agents_file)
+        if self._agents is not None and signature is not None and signature == self._agents_signature:
+            return self._agents
+
         try:
             with open(self.agents_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self._agents = [Agent.from_dict(a) for a in data]
+                data = json.loads(f.read())
         except (json.JSONDecodeError, IOError):
-            self._agents = []
+            data = []
+
+        # Reuse already-loaded instances instead of reallocating them
+        previous = self._agents or []
+        agents = []
+        seen = set()
+        for entry in data:
+            name = entry.get('name', '')
+            i = self._agent_index.get(name)
+            if i is None or name in seen:
+                agent = Agent.from_dict(entry)
+            else:
+                agent = previous[i]
+                agent.update_from_dict(entry)
+            seen.add(name)
+            agents.append(agent)
 
+        self._set_agents(agents)
+        self._agents_signature = signature
         return self._agents
 
+    def _set_agents(self, agents: List[Agent]) -> None:
+        """Cache the agent list and rebuild the name index."""
+        self._agents = agents
+        self._agent_index = {}
+        for i, agent in enumerate(agents):
+            self._agent_index.setdefault(agent.name, i)
+
     def _save_agents(self, agents: List[Agent]) -> None:
-        """Save agents to file."""
+        """Save agents to file (on the next flush)."""
+        with self._flush_lock:
+            self._set_agents(agents)
+            self._dirty_agents = True
+        self._schedule_flush()
+
+    def _write_agents(self) -> None:
+        """Write the cached agents to file."""
         self.agents_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.agents_file, 'w', encoding='utf-8') as f:
-            json.dump([a.to_dict() for a in agents], f, indent=2)
-        self._agents = agents
+        payload = json_dumps(self._agents or [], indent=True)
+        atomic_write(self.agents_file, payload)
+        self._agents_signature = file_signature(self.agents_file)
 
     def create_agent(self, agent: Agent) -> bool:
         """Create a new agent."""
         agents = self.get_agents()
 
         # Check for duplicate name
-        if any(a.name == agent.name for a in agents):
+        if agent.name in self._agent_index:
             return False
 
         agents.append(agent)
@@ -74,58 +154,174 @@ class AgentManager:
         """Update an existing agent."""
         agents = self.get_agents()
 
-        for i, agent in enumerate(agents):
-            if agent.name == name:
-                agents[i] = updated_agent
-                self._save_agents(agents)
-                return True
+        i = self._agent_index.get(name)
+        if i is None:
+            return False
 
-        return False
+        agents[i] = updated_agent
+        self._save_agents(agents)
+        return True
 
     def delete_agent(self, name: str) -> bool:
         """Delete an agent."""
         agents = self.get_agents()
-        original_count = len(agents)
-        agents = [a for a in agents if a.name != name]
 
-        if len(agents) < original_count:
-            self._save_agents(agents)
-            return True
+        i = self._agent_index.get(name)
+        if i is None:
+            return False
 
-        return False
+        del agents[i]
+        self._save_agents(agents)
+        return True
 
     def get_agent(self, name: str) -> Optional[Agent]:
         """Get agent by name."""
         agents = self.get_agents()
-        for agent in agents:
-            if agent.name == name:
-                return agent
-        return None
+        i = self._agent_index.get(name)
+        return agents[i] if i is not None else None
 
     def get_runs(self, force_refresh: bool = False) -> List[AgentRun]:
         """Get all agent runs."""
         if self._runs is not None and not force_refresh:
             return self._runs
 
-        self._ensure_files_exist()
-
-        try:
-            with open(self.runs_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self._runs = [AgentRun.from_dict(r) for r in data]
-        except (json.JSONDecodeError, IOError):
-            self._runs = []
+        # Worker threads finishing runs update the same list and stats
+        with self._flush_lock:
+            self.flush()
+            self._ensure_files_exist()
+
+            # Skip the reparse if the log hasn't changed since we last saw it
+            signature = file_signature(self.runs_file)
+            if self._runs is not None and signature is not None and signature == self._runs_signature:
+                return self._runs
+
+            # The log is append-only: the last line for a run_id holds its latest state.
+            # Finished runs never change again, so cached instances are reused as-is;
+            # running ones are reparsed rather than mutated under their worker thread.
+            pool = self._runs_by_id
+            latest: Dict[str, AgentRun] = {}
+            lines = 0
+            try:
+                with open(self.runs_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except IOError:
+                content = ''
+
+            for line in content.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                lines += 1
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                run = pool.get(data.get('run_id', ''))
+                if run is None or run.status == 'running':
+                    run = AgentRun.from_dict(data)
+                latest[run.run_id] = run
+
+            self._runs = sorted(latest.values(), key=lambda r: r.started, reverse=True)[:self.MAX_RUNS]
+            self._runs_by_id = {r.run_id: r for r in self._runs}
+            self._runs_log_lines = lines
+            self._runs_signature = signature
+
+            self._agent_stats = {}
+            for run in self._runs:
+                self._account_run(run)
+
+            if lines > self.COMPACT_AFTER_LINES:
+                self._compact_runs()
 
-        return self._runs
+            return self._runs
 
-    def _save_runs(self, runs: List[AgentRun]) -> None:
-        """Save runs to file."""
-        self.runs_file.parent.mkdir(parents=True, exist_ok=True)
-        # Keep only last 100 runs
-        runs = sorted(runs, key=lambda r: r.started, reverse=True)[:100]
-        with open(self.runs_file, 'w', encoding='utf-8') as f:
-            json.dump([r.to_dict() for r in runs], f, indent=2)
-        self._runs = runs
+    def _append_run(self, run: AgentRun) -> None:
+        """Append the current state of a run to the runs log (on the next flush)."""
+        # Runs are machine-only, so keep each record compact
+        line = json.dumps(run.to_dict(), separators=(',', ':')) + '\n'
+        with self._flush_lock:
+            self._pending_run_lines.append(line)
+            self._runs_log_lines += 1
+            if self._runs_log_lines > self.COMPACT_AFTER_LINES:
+                self._compact_runs()
+                return
+        self._schedule_flush()
+
+    def _compact_runs(self) -> None:
+        """Rewrite the runs log with one line per retained run."""
+        with self._flush_lock:
+            # The rewrite holds every run's latest state, superseding pending lines
+            self._pending_run_lines = []
+            runs = self._runs or []
+            payload = ''.join(
+                json.dumps(r.to_dict(), separators=(',', ':')) + '\n'
+                for r in runs
+            )
+            self.runs_file.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(self.runs_file, payload)
+            self._runs_log_lines = len(runs)
+            self._runs_signature = file_signature(self.runs_file)
+
+        self._prune_responses({r.run_id for r in runs})
+
+    def _store_response(self, run: AgentRun) -> None:
+        """Write a run's response to its sidecar file and reference it from the run."""
+        if not run.response:
+            return
+        self.responses_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.responses_dir / f"{run.run_id}.txt", 'w', encoding='utf-8') as f:
+            f.write(run.response)
+        run.response_path = f"{self.responses_dir.name}/{run.run_id}.txt"
+        # The sidecar holds the body now; cached runs keep only metadata
+        run.response = ""
+
+    def _prune_responses(self, keep_ids: Set[str]) -> None:
+        """Delete response sidecars for runs that are no longer retained."""
+        if not self.responses_dir.exists():
+            return
+        for path in self.responses_dir.glob('*.txt'):
+            if path.stem not in keep_ids:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def get_run_response(self, run: AgentRun) -> str:
+        """Get a run's response, loading it from its sidecar file if needed."""
+        if not run.response and run.response_path:
+            # Read on demand and not kept on the run, so viewed runs don't pin their bodies
+            try:
+                with open(self.runs_file.parent / run.response_path, 'r', encoding='utf-8') as f:
+                    return f.read()
+            except IOError:
+                pass
+        return run.response
+
+    def _schedule_flush(self) -> None:
+        """Arrange for pending writes to be flushed after FLUSH_DELAY."""
+        with self._flush_lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write any pending agent and run changes to disk."""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if self._dirty_agents:
+                self._write_agents()
+                self._dirty_agents = False
+
+            if self._pending_run_lines:
+                self.runs_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.runs_file, 'a', encoding='utf-8') as f:
+                    f.write(''.join(self._pending_run_lines))
+                self._pending_run_lines = []
+                self._runs_signature = file_signature(self.runs_file)
 
     def run_agent(
         self,
@@ -144,10 +340,17 @@ class AgentManager:
             status="running"
         )
 
-        # Add to runs
-        runs = self.get_runs()
-        runs.append(run)
-        self._save_runs(runs)
+        # Add to runs (newest first)
+        with self._flush_lock:
+            runs = self.get_runs()
+            runs.insert(0, run)
+            self._runs_by_id[run.run_id] = run
+            self._account_run(run)
+            for dropped in runs[self.MAX_RUNS:]:
+                self._runs_by_id.pop(dropped.run_id, None)
+                self._account_run(dropped, sign=-1)
+            del runs[self.MAX_RUNS:]
+            self._append_run(run)
 
         # Update agent usage
         agent.run_count += 1
@@ -155,12 +358,13 @@ class AgentManager:
         self.update_agent(agent.name, agent)
 
         if background:
-            thread = threading.Thread(
-                target=self._execute_agent,
-                args=(agent, prompt, run, callback)
-            )
-            thread.daemon = True
-            thread.start()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_CONCURRENT_RUNS,
+                    thread_name_prefix="agent-run"
+                )
+            self._queued_runs.add(run.run_id)
+            self._executor.submit(self._execute_agent, agent, prompt, run, callback)
         else:
             self._execute_agent(agent, prompt, run, callback)
 
@@ -174,10 +378,19 @@ class AgentManager:
         callback: Optional[Callable[[AgentRun], None]] = None
     ) -> None:
         """Execute agent in subprocess."""
+        self._queued_runs.discard(run.run_id)
         try:
+            if run.run_id in self._cancelled_runs:
+                raise RuntimeError("Cancelled before start")
+
+            # Resolve the CLI once; without a shell, Windows needs the full
+            # path to the claude.cmd shim
+            if self._claude_executable is None:
+                self._claude_executable = shutil.which("claude") or "claude"
+
             # Build claude command
             cmd = [
-                "claude",
+                self._claude_executable,
                 "--model", agent.model,
                 "--system-prompt", agent.system_prompt,
                 "--print",
@@ -188,8 +401,7 @@ class AgentManager:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                shell=True
+                text=True
             )
 
             self._running_processes[run.run_id] = process
@@ -212,19 +424,41 @@ class AgentManager:
             run.completed = datetime.now()
 
         finally:
-            if run.run_id in self._running_processes:
-                del self._running_processes[run.run_id]
-
-            # Update run in storage
-            runs = self.get_runs(force_refresh=True)
-            for i, r in enumerate(runs):
-                if r.run_id == run.run_id:
-                    runs[i] = run
-                    break
-            self._save_runs(runs)
-
-            if callback:
-                callback(run)
+            # Background runs have no one reading their future, so bookkeeping
+            # errors are recorded on the run and the callback always fires
+            try:
+                self._cancelled_runs.discard(run.run_id)
+                if run.run_id in self._running_processes:
+                    del self._running_processes[run.run_id]
+
+                try:
+                    self._store_response(run)
+                except IOError:
+                    pass  # Falls back to keeping the response inline
+
+                # Update the cached run; the list may have been reloaded since
+                # the run started, so swap in this instance if needed. The lock
+                # keeps the UI thread from reloading it part way through
+                with self._flush_lock:
+                    runs = self.get_runs()
+                    stored = self._runs_by_id.get(run.run_id)
+                    if stored is not None:
+                        if stored is not run:
+                            for i, cached in enumerate(runs):
+                                if cached.run_id == run.run_id:
+                                    runs[i] = run
+                                    break
+                            self._runs_by_id[run.run_id] = run
+                        # It was counted while running; add its outcome now
+                        self._account_run(run, count_run=False)
+                    self._append_run(run)
+            except Exception as e:
+                run.status = "failed"
+                run.error = run.error or f"Failed to record run: {e}"
+                run.completed = run.completed or datetime.now()
+            finally:
+                if callback:
+                    callback(run)
 
     def stop_run(self, run_id: str) -> bool:
         """Stop a running agent."""
@@ -232,13 +466,51 @@ class AgentManager:
             process = self._running_processes[run_id]
             process.terminate()
             return True
+        if run_id in self._queued_runs:
+            # Still waiting for a worker; it fails as soon as it is picked up
+            self._cancelled_runs.add(run_id)
+            return True
         return False
 
+    def shutdown(self) -> None:
+        """Stop running agents, release the background workers and flush writes."""
+        for run_id in list(self._queued_runs):
+            self._cancelled_runs.add(run_id)
+        for process in list(self._running_processes.values()):
+            process.terminate()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.flush()
+
+    def _account_run(self, run: AgentRun, sign: int = 1, count_run: bool = True) -> None:
+        """Add (sign=1) or remove (sign=-1) a run's contribution to its agent's stats."""
+        stats = self._agent_stats.setdefault(run.agent_name, {
+            'total_runs': 0,
+            'successful_runs': 0,
+            'failed_runs': 0,
+            'duration_sum': 0.0,
+            'duration_count': 0,
+            'total_tokens': 0
+        })
+
+        if count_run:
+            stats['total_runs'] += sign
+        if run.status == 'completed':
+            stats['successful_runs'] += sign
+        elif run.status == 'failed':
+            stats['failed_runs'] += sign
+        if run.completed:
+            stats['duration_sum'] += sign * (run.completed - run.started).total_seconds()
+            stats['duration_count'] += sign
+        stats['total_tokens'] += sign * run.tokens_used
+
     def get_agent_stats(self, agent_name: str) -> Dict[str, Any]:
         """Get statistics for an agent."""
-        runs = [r for r in self.get_runs() if r.agent_name == agent_name]
+        self.get_runs()
+        stats = self._agent_stats.get(agent_name)
 
-        if not runs:
+        if not stats or not stats['total_runs']:
             return {
                 'total_runs': 0,
                 'successful_runs': 0,
@@ -247,21 +519,12 @@ class AgentManager:
                 'total_tokens': 0
             }
 
-        successful = [r for r in runs if r.status == 'completed']
-        failed = [r for r in runs if r.status == 'failed']
-
-        durations = []
-        for r in runs:
-            if r.completed:
-                duration = (r.completed - r.started).total_seconds()
-                durations.append(duration)
-
         return {
-            'total_runs': len(runs),
-            'successful_runs': len(successful),
-            'failed_runs': len(failed),
-            'avg_duration': sum(durations) / len(durations) if durations else 0,
-            'total_tokens': sum(r.tokens_used for r in runs)
+            'total_runs': stats['total_runs'],
+            'successful_runs': stats['successful_runs'],
+            'failed_runs': stats['failed_runs'],
+            'avg_duration': stats['duration_sum'] / stats['duration_count'] if stats['duration_count'] else 0,
+            'total_tokens': stats['total_tokens']
         }
 
     def get_default_agents(self) -> List[Agent]:
@@ -3,10 +3,12 @@ Analytics management for Claude Code Manager.
 """
 
 import json
+import threading
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Optional, Callable
 
 from .config import Config
 from .models import DailyActivity, ModelUsage
@@ -23,6 +25,58 @@ MODEL_PRICING = {
     'claude-3-haiku-20240307': {'input': 0.25, 'output': 1.25, 'cache_read': 0.025, 'cache_create': 0.3},
 }
 
+DEFAULT_PRICING_MODEL = 'claude-sonnet-4-20250514'
+
+# Per-token prices as (input, output, cache_read, cache_create) tuples
+_SCALED_PRICING = {
+    model: (
+        p['input'] / 1_000_000,
+        p['output'] / 1_000_000,
+        p['cache_read'] / 1_000_000,
+        p['cache_create'] / 1_000_000,
+    )
+    for model, p in MODEL_PRICING.items()
+}
+_DEFAULT_SCALED_PRICING = _SCALED_PRICING[DEFAULT_PRICING_MODEL]
+
+# Estimated input/output split for token counts that are not broken down
+ESTIMATED_INPUT_RATIO = 0.75
+ESTIMATED_OUTPUT_RATIO = 0.25
+
+# Per-token price for undifferentiated token counts, using the split above
+_BLENDED_PRICING = {
+    model: ESTIMATED_INPUT_RATIO * p[0] + ESTIMATED_OUTPUT_RATIO * p[1]
+    for model, p in _SCALED_PRICING.items()
+}
+_DEFAULT_BLENDED_PRICING = _BLENDED_PRICING[DEFAULT_PRICING_MODEL]
+
+
+# Marks a memo key that hasn't been computed yet
+_MISSING = object()
+
+
+@lru_cache(maxsize=16)
+def _cutoff_date(days: int, today_ordinal: int) -> str:
+    """Return the YYYY-MM-DD date `days` before the given day."""
+    return (date.fromordinal(today_ordinal) - timedelta(days=days)).isoformat()
+
+
+def _date_cutoff(days: int) -> str:
+    """Return the YYYY-MM-DD date `days` before today."""
+    return _cutoff_date(days, date.today().toordinal())
+
+
+@lru_cache(maxsize=512)
+def _week_start(day: str) -> str:
+    """Return the Monday (YYYY-MM-DD) of the week containing day."""
+    d = date.fromisoformat(day)
+    return (d - timedelta(days=d.weekday())).isoformat()
+
+
+def _month_of(day: str) -> str:
+    """Return the YYYY-MM month of a YYYY-MM-DD day."""
+    return day[:7]
+
 
 class AnalyticsManager:
     """Manages usage analytics and cost tracking."""
@@ -30,17 +84,50 @@ class AnalyticsManager:
     def __init__(self, config: Config):
         self.config = config
         self._stats_cache: Optional[Dict[str, Any]] = None
+        # Derived views are memoised per stats-cache generation
+        self._cache_version = 0
+        self._memo_version = 0
+        self._memo: Dict[Any, Any] = {}
+        # The status bar's stats worker reads these while the UI thread may reload them
+        self._lock = threading.RLock()
 
     def get_stats_cache(self, force_refresh: bool = False) -> Dict[str, Any]:
         """Load stats cache."""
-        if self._stats_cache is not None and not force_refresh:
+        with self._lock:
+            if self._stats_cache is not None and not force_refresh:
+                return self._stats_cache
+
+            stats = self.config.get_stats_cache()
+            # Config hands back the same dict while the file is unchanged
+            if stats is not self._stats_cache:
+                self._stats_cache = stats
+                self._cache_version += 1
             return self._stats_cache
 
-        self._stats_cache = self.config.get_stats_cache()
-        return self._stats_cache
+    @property
+    def data_version(self) -> int:
+        """Generation of the loaded stats cache, bumped whenever it reloads with new data."""
+        return self._cache_version
+
+    def _memoized(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return a derived view, recomputing it only after the stats cache reloads."""
+        with self._lock:
+            self.get_stats_cache()
+            if self._memo_version != self._cache_version:
+                self._memo = {}
+                self._memo_version = self._cache_version
+            value = self._memo.get(key, _MISSING)
+            if value is _MISSING:
+                value = self._memo[key] = compute()
+            return value
 
     def get_daily_activity(self, days: int = 30) -> List[DailyActivity]:
         """Get daily activity for the specified number of days."""
+        key = ('daily_activity', _date_cutoff(days) if days > 0 else None)
+        return self._memoized(key, lambda: self._build_daily_activity(days))
+
+    def _build_daily_activity(self, days: int) -> List[DailyActivity]:
+        """Build daily activity entries from the stats cache."""
         stats = self.get_stats_cache()
         daily_data = stats.get('dailyActivity', [])
 
@@ -58,13 +145,18 @@ class AnalyticsManager:
 
         # Filter to last N days
         if days > 0:
-            cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-            activities = [a for a in activities if a.date >= cutoff]
+            # Already sorted by date, so slice from the first day in range
+            dates = [a.date for a in activities]
+            activities = activities[bisect_left(dates, _date_cutoff(days)):]
 
         return activities
 
     def get_model_usage(self) -> Dict[str, ModelUsage]:
         """Get usage statistics by model."""
+        return self._memoized('model_usage', self._build_model_usage)
+
+    def _build_model_usage(self) -> Dict[str, ModelUsage]:
+        """Build per-model usage from the stats cache."""
         stats = self.get_stats_cache()
         model_data = stats.get('modelUsage', {})
 
@@ -85,18 +177,22 @@ class AnalyticsManager:
     def calculate_cost(self, model: str, input_tokens: int, output_tokens: int,
                        cache_read: int = 0, cache_create: int = 0) -> float:
         """Calculate cost for token usage."""
-        pricing = MODEL_PRICING.get(model, MODEL_PRICING.get('claude-sonnet-4-20250514'))
-
-        cost = 0.0
-        cost += (input_tokens / 1_000_000) * pricing['input']
-        cost += (output_tokens / 1_000_000) * pricing['output']
-        cost += (cache_read / 1_000_000) * pricing['cache_read']
-        cost += (cache_create / 1_000_000) * pricing['cache_create']
-
-        return cost
+        p_input, p_output, p_cache_read, p_cache_create = _SCALED_PRICING.get(
+            model, _DEFAULT_SCALED_PRICING
+        )
+        return (
+            input_tokens * p_input
+            + output_tokens * p_output
+            + cache_read * p_cache_read
+            + cache_create * p_cache_create
+        )
 
     def get_total_cost(self) -> float:
         """Calculate total estimated cost."""
+        return self._memoized('total_cost', self._build_total_cost)
+
+    def _build_total_cost(self) -> float:
+        """Sum the estimated cost over all models."""
         usage = self.get_model_usage()
         total = 0.0
 
@@ -113,13 +209,19 @@ class AnalyticsManager:
 
     def get_summary_stats(self) -> Dict[str, Any]:
         """Get summary statistics."""
+        return self._memoized('summary_stats', self._build_summary_stats)
+
+    def _build_summary_stats(self) -> Dict[str, Any]:
+        """Build summary statistics from the stats cache."""
         stats = self.get_stats_cache()
         usage = self.get_model_usage()
 
-        total_input = sum(u.input_tokens for u in usage.values())
-        total_output = sum(u.output_tokens for u in usage.values())
-        total_cache_read = sum(u.cache_read_tokens for u in usage.values())
-        total_cache_create = sum(u.cache_creation_tokens for u in usage.values())
+        total_input = total_output = total_cache_read = total_cache_create = 0
+        for u in usage.values():
+            total_input += u.input_tokens
+            total_output += u.output_tokens
+            total_cache_read += u.cache_read_tokens
+            total_cache_create += u.cache_creation_tokens
 
         return {
             'total_sessions': stats.get('totalSessions', 0),
@@ -136,6 +238,11 @@ class AnalyticsManager:
 
     def get_tokens_by_day(self, days: int = 30) -> List[Dict[str, Any]]:
         """Get token usage by day."""
+        key = ('tokens_by_day', _date_cutoff(days) if days > 0 else None)
+        return self._memoized(key, lambda: self._build_tokens_by_day(days))
+
+    def _build_tokens_by_day(self, days: int) -> List[Dict[str, Any]]:
+        """Build per-day token totals from the stats cache."""
         stats = self.get_stats_cache()
         daily_tokens = stats.get('dailyModelTokens', [])
 
@@ -156,113 +263,100 @@ class AnalyticsManager:
 
         # Filter to last N days
         if days > 0:
-            cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-            result = [r for r in result if r['date'] >= cutoff]
+            dates = [r['date'] for r in result]
+            result = result[bisect_left(dates, _date_cutoff(days)):]
 
         return result
 
     def get_cost_by_period(self, period: str = 'day') -> List[Dict[str, Any]]:
         """Get cost breakdown by period (day, week, month)."""
-        tokens_by_day = self.get_tokens_by_day(days=365)
-
         if period == 'day':
-            return [
-                {
-                    'period': t['date'],
-                    'cost': self._estimate_cost_for_tokens(t['by_model'])
-                }
-                for t in tokens_by_day
-            ]
-
+            bucket_of = str
         elif period == 'week':
-            weekly = defaultdict(lambda: defaultdict(int))
-            for t in tokens_by_day:
-                date = datetime.strptime(t['date'], '%Y-%m-%d')
-                week_start = (date - timedelta(days=date.weekday())).strftime('%Y-%m-%d')
-                for model, tokens in t['by_model'].items():
-                    weekly[week_start][model] += tokens
-
-            return [
-                {'period': week, 'cost': self._estimate_cost_for_tokens(dict(models))}
-                for week, models in sorted(weekly.items())
-            ]
-
+            bucket_of = _week_start
         elif period == 'month':
-            monthly = defaultdict(lambda: defaultdict(int))
-            for t in tokens_by_day:
-                month = t['date'][:7]  # YYYY-MM
-                for model, tokens in t['by_model'].items():
-                    monthly[month][model] += tokens
+            bucket_of = _month_of
+        else:
+            return []
 
-            return [
-                {'period': month, 'cost': self._estimate_cost_for_tokens(dict(models))}
-                for month, models in sorted(monthly.items())
-            ]
+        # Cost is linear in tokens, so each day can be priced once and summed
+        costs: Dict[str, float] = {}
+        for t in self.get_tokens_by_day(days=365):
+            bucket = bucket_of(t['date'])
+            costs[bucket] = costs.get(bucket, 0.0) + self._estimate_cost_for_tokens(t['by_model'])
 
-        return []
+        return [
+            {'period': bucket, 'cost': cost}
+            for bucket, cost in sorted(costs.items())
+        ]
 
     def _estimate_cost_for_tokens(self, tokens_by_model: Dict[str, int]) -> float:
-        """Estimate cost from token counts (assuming 1:3 input:output ratio)."""
-        total = 0.0
-        for model, tokens in tokens_by_model.items():
-            # Assume 75% input, 25% output ratio
-            input_tokens = int(tokens * 0.75)
-            output_tokens = int(tokens * 0.25)
-            total += self.calculate_cost(model, input_tokens, output_tokens)
-        return total
+        """Estimate cost from token counts (assuming 3:1 input:output ratio)."""
+        return sum(
+            (tokens * _BLENDED_PRICING.get(model, _DEFAULT_BLENDED_PRICING)
+             for model, tokens in tokens_by_model.items()),
+            0.0
+        )
 
     def export_analytics(self, filepath: Path, format: str = 'json') -> bool:
         """Export analytics data to file."""
         try:
-            data = {
-                'summary': self.get_summary_stats(),
-                'daily_activity': [
-                    {
-                        'date': a.date,
-                        'message_count': a.message_count,
-                        'session_count': a.session_count,
-                        'tool_call_count': a.tool_call_count
-                    }
-                    for a in self.get_daily_activity(days=365)
-                ],
-                'model_usage': {
-                    model: {
-                        'input_tokens': u.input_tokens,
-                        'output_tokens': u.output_tokens,
-                        'cache_read_tokens': u.cache_read_tokens,
-                        'cache_creation_tokens': u.cache_creation_tokens,
-                        'estimated_cost': self.calculate_cost(
-                            model, u.input_tokens, u.output_tokens,
-                            u.cache_read_tokens, u.cache_creation_tokens
-                        )
-                    }
-                    for model, u in self.get_model_usage().items()
-                },
-                'tokens_by_day': self.get_tokens_by_day(days=365),
-                'export_date': datetime.now().isoformat()
-            }
-
             if format == 'json':
+                payload = json.dumps(self._build_export_data(), indent=2)
                 with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
+                    f.write(payload)
             elif format == 'csv':
-                import csv
-                with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['Date', 'Messages', 'Sessions', 'Tool Calls', 'Tokens'])
-                    for activity in data['daily_activity']:
-                        tokens = next(
-                            (t['total_tokens'] for t in data['tokens_by_day'] if t['date'] == activity['date']),
-                            0
-                        )
-                        writer.writerow([
-                            activity['date'],
-                            activity['message_count'],
-                            activity['session_count'],
-                            activity['tool_call_count'],
-                            tokens
-                        ])
+                self._export_csv(filepath)
 
             return True
         except IOError:
             return False
+
+    def _build_export_data(self) -> Dict[str, Any]:
+        """Build the full analytics document for JSON export."""
+        return {
+            'summary': self.get_summary_stats(),
+            'daily_activity': [
+                {
+                    'date': a.date,
+                    'message_count': a.message_count,
+                    'session_count': a.session_count,
+                    'tool_call_count': a.tool_call_count
+                }
+                for a in self.get_daily_activity(days=365)
+            ],
+            'model_usage': {
+                model: {
+                    'input_tokens': u.input_tokens,
+                    'output_tokens': u.output_tokens,
+                    'cache_read_tokens': u.cache_read_tokens,
+                    'cache_creation_tokens': u.cache_creation_tokens,
+                    'estimated_cost': self.calculate_cost(
+                        model, u.input_tokens, u.output_tokens,
+                        u.cache_read_tokens, u.cache_creation_tokens
+                    )
+                }
+                for model, u in self.get_model_usage().items()
+            },
+            'tokens_by_day': self.get_tokens_by_day(days=365),
+            'export_date': datetime.now().isoformat()
+        }
+
+    def _export_csv(self, filepath: Path) -> None:
+        """Stream daily activity rows, joined with token totals, to a CSV file."""
+        import csv
+        tokens_index = {t['date']: t['total_tokens'] for t in self.get_tokens_by_day(days=365)}
+
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Date', 'Messages', 'Sessions', 'Tool Calls', 'Tokens'])
+            writer.writerows(
+                [
+                    a.date,
+                    a.message_count,
+                    a.session_count,
+                    a.tool_call_count,
+                    tokens_index.get(a.date, 0)
+                ]
+                for a in self.get_daily_activity(days=365)
+            )
@@ -2,32 +2,58 @@
 Checkpoint management for Claude Code Manager.
 """
 
+import os
+import re
 import json
+import mmap
 import uuid
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Union
 import difflib
 
-from .config import Config
+from .config import Config, atomic_write, json_dumps, json_loads
 from .models import Checkpoint, Message
 
 
 class CheckpointManager:
     """Manages session checkpoints and timeline."""
 
+    # Compact the index journal once it holds this many lines per live checkpoint
+    COMPACT_RATIO = 2
+    # ...but never bother for journals shorter than this
+    COMPACT_MIN_LINES = 50
+    # Session record types shown as conversation messages
+    MESSAGE_TYPES = frozenset({'user', 'assistant'})
+    # A record's "sessionId" field, capturing everything before the value
+    SESSION_ID_FIELD = re.compile(rb'("sessionId"\s*:\s*)"[^"\\]*"')
+
     def __init__(self, config: Config):
         self.config = config
         self.checkpoints_dir = config.claude_dir / "claude-code-manager-py" / "checkpoints"
-        self.checkpoints_file = self.checkpoints_dir / "index.json"
+        self.checkpoints_file = self.checkpoints_dir / "index.jsonl"
+        self.legacy_checkpoints_file = self.checkpoints_dir / "index.json"
         self._checkpoints: Optional[List[Checkpoint]] = None
+        self._journal_lines = 0
 
     def _ensure_dir_exists(self) -> None:
         """Ensure checkpoints directory exists."""
         self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
         if not self.checkpoints_file.exists():
-            self._save_checkpoints([])
+            self._migrate_legacy_index()
+
+    def _migrate_legacy_index(self) -> None:
+        """Convert the old index.json array into the JSONL journal."""
+        records = []
+        if self.legacy_checkpoints_file.exists():
+            try:
+                with open(self.legacy_checkpoints_file, 'r', encoding='utf-8') as f:
+                    records = json_loads(f.read())
+            except (json.JSONDecodeError, IOError):
+                records = []
+
+        atomic_write(self.checkpoints_file, ''.join(json_dumps(r) + '\n' for r in records))
 
     def get_checkpoints(self, session_id: Optional[str] = None, force_refresh: bool = False) -> List[Checkpoint]:
         """Get all checkpoints, optionally filtered by session."""
@@ -35,21 +61,60 @@ class CheckpointManager:
             self._ensure_dir_exists()
             try:
                 with open(self.checkpoints_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._checkpoints = [Checkpoint.from_dict(c) for c in data]
-            except (json.JSONDecodeError, IOError):
-                self._checkpoints = []
+                    content = f.read()
+            except IOError:
+                content = ''
+
+            # Each line is a checkpoint record or a {"deleted": id} tombstone;
+            # the last record for a checkpoint id holds its current state
+            latest: Dict[str, Checkpoint] = {}
+            lines = 0
+            for line in content.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                lines += 1
+                try:
+                    data = json_loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if 'deleted' in data:
+                    latest.pop(data['deleted'], None)
+                    continue
+                checkpoint = Checkpoint.from_dict(data)
+                latest[checkpoint.checkpoint_id] = checkpoint
+
+            self._checkpoints = list(latest.values())
+            self._journal_lines = lines
+            if self._needs_compaction():
+                self._save_checkpoints(self._checkpoints)
 
         if session_id:
             return [c for c in self._checkpoints if c.session_id == session_id]
         return self._checkpoints
 
+    def _needs_compaction(self) -> bool:
+        """Check whether the journal has grown well past the live checkpoint count."""
+        live = len(self._checkpoints or [])
+        return self._journal_lines > max(self.COMPACT_MIN_LINES, self.COMPACT_RATIO * live)
+
+    def _append_records(self, records: List[Union[Checkpoint, Dict[str, Any]]]) -> None:
+        """Append checkpoint records or tombstones to the index journal."""
+        self._ensure_dir_exists()
+        with open(self.checkpoints_file, 'a', encoding='utf-8') as f:
+            f.write(''.join(json_dumps(r) + '\n' for r in records))
+        self._journal_lines += len(records)
+        if self._needs_compaction():
+            self._save_checkpoints(self._checkpoints or [])
+
     def _save_checkpoints(self, checkpoints: List[Checkpoint]) -> None:
-        """Save checkpoints to file."""
+        """Rewrite the index journal as a snapshot with one line per checkpoint."""
         self._ensure_dir_exists()
-        with open(self.checkpoints_file, 'w', encoding='utf-8') as f:
-            json.dump([c.to_dict() for c in checkpoints], f, indent=2)
+        atomic_write(self.checkpoints_file, ''.join(
+            json_dumps(c) + '\n' for c in checkpoints
+        ))
         self._checkpoints = checkpoints
+        self._journal_lines = len(checkpoints)
 
     def create_checkpoint(
         self,
@@ -80,32 +145,35 @@ class CheckpointManager:
         # Copy session file up to the checkpoint message
         session_file = Path(session_path)
         if session_file.exists():
-            messages_up_to_checkpoint = []
-            with open(session_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line)
-                        messages_up_to_checkpoint.append(data)
-                        if data.get('uuid') == message_uuid:
-                            break
-                    except json.JSONDecodeError:
-                        continue
-
-            # Save checkpoint session data
-            with open(checkpoint_data_dir / "session.jsonl", 'w', encoding='utf-8') as f:
-                for msg in messages_up_to_checkpoint:
-                    f.write(json.dumps(msg) + '\n')
+            self._copy_session_prefix(session_file, checkpoint_data_dir / "session.jsonl", message_uuid)
 
         # Add to index
-        checkpoints = self.get_checkpoints()
-        checkpoints.append(checkpoint)
-        self._save_checkpoints(checkpoints)
+        self.get_checkpoints().append(checkpoint)
+        self._append_records([checkpoint])
 
         return checkpoint
 
+    def _copy_session_prefix(self, session_file: Path, dest: Path, message_uuid: str) -> None:
+        """Copy session lines up to and including the line with the given message uuid."""
+        # Locate the message by its raw bytes instead of parsing every line
+        needle = re.compile(rb'"uuid"\s*:\s*"' + re.escape(message_uuid.encode('utf-8')) + rb'"')
+
+        with open(session_file, 'rb') as src, open(dest, 'wb') as dst:
+            size = os.fstat(src.fileno()).st_size
+            if not size:
+                return
+
+            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = size
+                match = needle.search(mm)
+                if match:
+                    newline = mm.find(b'\n', match.end())
+                    if newline != -1:
+                        end = newline + 1
+                dst.write(mm[:end])
+                if mm[end - 1:end] != b'\n':
+                    dst.write(b'\n')
+
     def get_checkpoint(self, checkpoint_id: str) -> Optional[Checkpoint]:
         """Get checkpoint by ID."""
         checkpoints = self.get_checkpoints()
@@ -118,12 +186,17 @@ class CheckpointManager:
         """Delete a checkpoint."""
         checkpoints = self.get_checkpoints()
 
-        # Find and remove checkpoint
+        # Find the checkpoint and its children in a single pass
         checkpoint = None
+        children = []
+        remaining = []
         for cp in checkpoints:
             if cp.checkpoint_id == checkpoint_id:
                 checkpoint = cp
-                break
+                continue
+            if cp.parent_checkpoint_id == checkpoint_id:
+                children.append(cp)
+            remaining.append(cp)
 
         if not checkpoint:
             return False
@@ -134,13 +207,12 @@ class CheckpointManager:
             shutil.rmtree(checkpoint_data_dir)
 
         # Update children to point to parent
-        for cp in checkpoints:
-            if cp.parent_checkpoint_id == checkpoint_id:
-                cp.parent_checkpoint_id = checkpoint.parent_checkpoint_id
+        for cp in children:
+            cp.parent_checkpoint_id = checkpoint.parent_checkpoint_id
 
         # Remove from index
-        checkpoints = [c for c in checkpoints if c.checkpoint_id != checkpoint_id]
-        self._save_checkpoints(checkpoints)
+        self._checkpoints = remaining
+        self._append_records(children + [{'deleted': checkpoint_id}])
 
         return True
 
@@ -188,16 +260,35 @@ class CheckpointManager:
         # Create new session file
         new_session_path = project_path / f"{new_session_id}.jsonl"
 
-        # Copy checkpoint data and update session ID
-        with open(checkpoint_session, 'r', encoding='utf-8') as src:
-            with open(new_session_path, 'w', encoding='utf-8') as dst:
+        # Copy checkpoint data and update session ID. The id is swapped in the
+        # raw bytes, so only lines without a sessionId field are re-serialized
+        new_id_json = json_dumps(new_session_id).encode('utf-8')
+
+        def replace_id(match):
+            return match.group(1) + new_id_json
+
+        with open(checkpoint_session, 'rb') as src:
+            with open(new_session_path, 'wb') as dst:
                 for line in src:
-                    try:
-                        data = json.loads(line.strip())
-                        data['sessionId'] = new_session_id
-                        dst.write(json.dumps(data) + '\n')
-                    except json.JSONDecodeError:
+                    if not line.strip():
                         continue
+                    line, replaced = self.SESSION_ID_FIELD.subn(replace_id, line, count=1)
+                    if replaced:
+                        # Drop truncated or malformed lines, as a full parse would
+                        try:
+                            json_loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        if not line.endswith(b'\n'):
+                            line += b'\n'
+                    else:
+                        try:
+                            data = json_loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        data['sessionId'] = new_session_id
+                        line = (json_dumps(data) + '\n').encode('utf-8')
+                    dst.write(line)
 
         # Create checkpoint for the fork
         self.create_checkpoint(
@@ -214,46 +305,39 @@ class CheckpointManager:
 
     def get_checkpoint_messages(self, checkpoint_id: str) -> List[Dict[str, Any]]:
         """Get messages from a checkpoint."""
-        checkpoint_data_dir = self.checkpoints_dir / checkpoint_id
-        checkpoint_session = checkpoint_data_dir / "session.jsonl"
-
-        messages = []
-        if checkpoint_session.exists():
-            with open(checkpoint_session, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line)
-                        if data.get('type') in ['user', 'assistant']:
-                            messages.append(data)
-                    except json.JSONDecodeError:
-                        continue
-
-        return messages
+        return list(self._iter_messages(checkpoint_id))
 
-    def get_diff_between_checkpoints(self, checkpoint_id_1: str, checkpoint_id_2: str) -> List[str]:
-        """Get diff between two checkpoints."""
-        messages1 = self.get_checkpoint_messages(checkpoint_id_1)
-        messages2 = self.get_checkpoint_messages(checkpoint_id_2)
-
-        # Extract content for comparison
-        content1 = []
-        for msg in messages1:
+    def _iter_messages(self, checkpoint_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream user/assistant records from a checkpoint's session file."""
+        checkpoint_session = self.checkpoints_dir / checkpoint_id / "session.jsonl"
+        if not checkpoint_session.exists():
+            return
+
+        with open(checkpoint_session, 'rb') as f:
+            for line in f:
+                # Every user/assistant record mentions its type, so lines
+                # without either word can be skipped without parsing
+                if b'"user"' not in line and b'"assistant"' not in line:
+                    continue
+                try:
+                    data = json_loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if data.get('type') in self.MESSAGE_TYPES:
+                    yield data
+
+    def _iter_message_summaries(self, checkpoint_id: str) -> Iterator[str]:
+        """Stream one truncated "[role]: text" line per plain-text checkpoint message."""
+        for msg in self._iter_messages(checkpoint_id):
             message = msg.get('message', {})
-            role = message.get('role', '')
             text = message.get('content', '')
             if isinstance(text, str):
-                content1.append(f"[{role}]: {text[:200]}...")
+                yield f"[{message.get('role', '')}]: {text[:200]}..."
 
-        content2 = []
-        for msg in messages2:
-            message = msg.get('message', {})
-            role = message.get('role', '')
-            text = message.get('content', '')
-            if isinstance(text, str):
-                content2.append(f"[{role}]: {text[:200]}...")
+    def get_diff_between_checkpoints(self, checkpoint_id_1: str, checkpoint_id_2: str) -> List[str]:
+        """Get diff between two checkpoints."""
+        content1 = list(self._iter_message_summaries(checkpoint_id_1))
+        content2 = list(self._iter_message_summaries(checkpoint_id_2))
 
         # Generate diff
         diff = list(difflib.unified_diff(
@@ -269,14 +353,16 @@ class CheckpointManager:
         """Get checkpoint timeline for a session."""
         checkpoints = self.get_checkpoints(session_id)
 
-        # Build tree structure
-        root_checkpoints = [c for c in checkpoints if c.parent_checkpoint_id is None]
+        # Build tree structure from a parent -> children index
+        children_by_parent: Dict[Optional[str], List[Checkpoint]] = {}
+        for c in checkpoints:
+            children_by_parent.setdefault(c.parent_checkpoint_id, []).append(c)
+        root_checkpoints = children_by_parent.get(None, [])
 
         def build_tree(cp: Checkpoint) -> Dict[str, Any]:
-            children = [c for c in checkpoints if c.parent_checkpoint_id == cp.checkpoint_id]
             return {
                 'checkpoint': cp.to_dict(),
-                'children': [build_tree(child) for child in children]
+                'children': [build_tree(child) for child in children_by_parent.get(cp.checkpoint_id, [])]
             }
 
         return {
@@ -3,146 +3,35 @@ CLAUDE.md file management for Claude Code Manager.
 """
 
 import os
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
-from .config import Config
+from .config import Config, HOME_DIR, IS_WINDOWS, file_signature
 
 
-class ClaudeMdManager:
-    """Manages CLAUDE.md files across projects."""
-
-    CLAUDE_MD_NAMES = ['CLAUDE.md', 'claude.md', '.claude.md', 'CLAUDE.local.md']
-
-    def __init__(self, config: Config):
-        self.config = config
-        self._cache: Dict[str, List[Dict[str, Any]]] = {}
-
-    def find_claude_md_files(self, root_path: Optional[Path] = None, max_depth: int = 5) -> List[Dict[str, Any]]:
-        """Find all CLAUDE.md files in a directory tree."""
-        if root_path is None:
-            # Search in home directory and common project locations
-            search_paths = [
-                Path.home(),
-                Path.home() / "projects",
-                Path.home() / "code",
-                Path.home() / "github",
-                Path.home() / "repos",
-            ]
-            # Add Windows-specific paths
-            if os.name == 'nt':
-                search_paths.extend([
-                    Path("D:/github-repos-personal"),
-                    Path("D:/projects"),
-                    Path("C:/Users") / os.environ.get('USERNAME', '') / "Documents",
-                ])
-        else:
-            search_paths = [root_path]
-
-        results = []
-
-        for search_path in search_paths:
-            if not search_path.exists():
-                continue
-
-            for claude_file in self._find_files(search_path, max_depth):
-                results.append(claude_file)
-
-        # Remove duplicates based on path
-        seen = set()
-        unique_results = []
-        for r in results:
-            if r['path'] not in seen:
-                seen.add(r['path'])
-                unique_results.append(r)
-
-        return sorted(unique_results, key=lambda x: x['modified'], reverse=True)
-
-    def _find_files(self, root: Path, max_depth: int, current_depth: int = 0) -> List[Dict[str, Any]]:
-        """Recursively find CLAUDE.md files."""
-        results = []
-
-        if current_depth > max_depth:
-            return results
-
-        try:
-            for item in root.iterdir():
-                if item.is_file() and item.name in self.CLAUDE_MD_NAMES:
-                    stat = item.stat()
-                    results.append({
-                        'path': str(item),
-                        'name': item.name,
-                        'project': item.parent.name,
-                        'project_path': str(item.parent),
-                        'size': stat.st_size,
-                        'modified': datetime.fromtimestamp(stat.st_mtime),
-                        'is_local': '.local' in item.name
-                    })
-                elif item.is_dir() and not item.name.startswith('.') and item.name not in ['node_modules', 'venv', '.git', '__pycache__', 'dist', 'build']:
-                    results.extend(self._find_files(item, max_depth, current_depth + 1))
-        except PermissionError:
-            pass
-
-        return results
-
-    def read_claude_md(self, file_path: str) -> Optional[str]:
-        """Read content of a CLAUDE.md file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except IOError:
-            return None
-
-    def write_claude_md(self, file_path: str, content: str) -> bool:
-        """Write content to a CLAUDE.md file."""
-        try:
-            # Create backup
-            path = Path(file_path)
-            if path.exists():
-                backup_path = path.with_suffix('.md.backup')
-                with open(path, 'r', encoding='utf-8') as f:
-                    original = f.read()
-                with open(backup_path, 'w', encoding='utf-8') as f:
-                    f.write(original)
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        except IOError:
-            return False
+# Home directory and common project locations searched by default
+DEFAULT_SEARCH_PATHS = (
+    HOME_DIR,
+    HOME_DIR / "projects",
+    HOME_DIR / "code",
+    HOME_DIR / "github",
+    HOME_DIR / "repos",
+)
+if IS_WINDOWS:
+    DEFAULT_SEARCH_PATHS += (
+        Path("D:/github-repos-personal"),
+        Path("D:/projects"),
+        Path("C:/Users") / os.environ.get('USERNAME', '') / "Documents",
+    )
 
-    def create_claude_md(self, project_path: str, content: str = "", local: bool = False) -> Optional[str]:
-        """Create a new CLAUDE.md file in a project."""
-        filename = 'CLAUDE.local.md' if local else 'CLAUDE.md'
-        file_path = Path(project_path) / filename
-
-        if file_path.exists():
-            return None  # Already exists
-
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content or self.get_template())
-            return str(file_path)
-        except IOError:
-            return None
-
-    def delete_claude_md(self, file_path: str) -> bool:
-        """Delete a CLAUDE.md file (moves to backup)."""
-        try:
-            path = Path(file_path)
-            if path.exists():
-                backup_path = path.with_suffix('.md.deleted')
-                path.rename(backup_path)
-                return True
-        except IOError:
-            pass
-        return False
 
-    def get_template(self, template_name: str = "default") -> str:
-        """Get a CLAUDE.md template."""
-        templates = {
-            "default": """# Project Guidelines
+# Static CLAUDE.md templates, shared by every get_template call
+_TEMPLATES = {
+    "default": """# Project Guidelines
 
 ## Overview
 Brief description of the project and its purpose.
@@ -167,7 +56,7 @@ Describe the overall architecture and structure.
 ## Common Tasks
 Describe how to perform common operations.
 """,
-            "python": """# Python Project Guidelines
+    "python": """# Python Project Guidelines
 
 ## Overview
 Brief description of the project.
@@ -196,7 +85,7 @@ pytest tests/
 - Virtual environment recommended
 - Check .env.example for required environment variables
 """,
-            "javascript": """# JavaScript/Node.js Project Guidelines
+    "javascript": """# JavaScript/Node.js Project Guidelines
 
 ## Overview
 Brief description of the project.
@@ -224,7 +113,7 @@ npm install
 ## Important Notes
 - Check .env.example for required environment variables
 """,
-            "react": """# React Project Guidelines
+    "react": """# React Project Guidelines
 
 ## Overview
 Brief description of the application.
@@ -255,47 +144,252 @@ npm run dev
 - Components should be small and focused
 - Use React.memo for performance when needed
 """,
-            "minimal": """# Project Guidelines
+    "minimal": """# Project Guidelines
 
 Key information for Claude to know about this project.
 """
-        }
-        return templates.get(template_name, templates["default"])
+}
+
+_AVAILABLE_TEMPLATES = [
+    {"name": "default", "description": "General purpose template"},
+    {"name": "python", "description": "Python project template"},
+    {"name": "javascript", "description": "JavaScript/Node.js template"},
+    {"name": "react", "description": "React application template"},
+    {"name": "minimal", "description": "Minimal template"}
+]
+
+
+class ClaudeMdManager:
+    """Manages CLAUDE.md files across projects."""
+
+    CLAUDE_MD_NAMES = frozenset({'CLAUDE.md', 'claude.md', '.claude.md', 'CLAUDE.local.md'})
+    SKIP_DIRS = frozenset({
+        'node_modules', 'venv', '.venv', '.git', '__pycache__', 'dist', 'build',
+        'target', 'vendor', '.tox', '.mypy_cache', '.pytest_cache', 'Pods',
+    })
+    # Stop reading a directory after this many entries if none of them matched
+    MAX_DIR_ENTRIES = 10_000
+    READ_CACHE_SIZE = 128
+    # Upper bound on search roots walked concurrently
+    MAX_SCAN_WORKERS = 8
+
+    def __init__(self, config: Config):
+        self.config = config
+        # Walk results by (max_depth, roots), with the roots' change token they were found at
+        self._cache: Dict[Any, Tuple[Any, List[Dict[str, Any]]]] = {}
+        # File contents keyed by path, valid while the file signature matches
+        self._read_cache: 'OrderedDict[str, Tuple[Tuple[int, int], str]]' = OrderedDict()
+
+    def find_claude_md_files(self, root_path: Optional[Path] = None, max_depth: int = 5,
+                             force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """Find all CLAUDE.md files in a directory tree."""
+        if root_path is None:
+            search_paths = DEFAULT_SEARCH_PATHS
+        else:
+            search_paths = (root_path,)
+
+        # Reuse the last walk while none of the search roots have changed
+        token = []
+        roots = []
+        for search_path in search_paths:
+            root_token = self._root_token(search_path)
+            if root_token is None:
+                continue
+            token.append(root_token)
+            roots.append(search_path)
+        token = tuple(token)
+        cache_key = ('find', max_depth, tuple(str(root) for root in roots))
+        cached = self._cache.get(cache_key)
+        if not force_refresh and cached is not None and cached[0] == token:
+            return list(cached[1])
+
+        # Roots can overlap (e.g. home and ~/projects), so drop duplicate paths as they arrive
+        seen = set()
+        unique_results = []
+
+        # The walks are I/O-bound and independent, so run one per root in parallel
+        if roots:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_SCAN_WORKERS, len(roots))) as executor:
+                for found in executor.map(lambda root: self._find_files(root, max_depth), roots):
+                    for r in found:
+                        if r['path'] not in seen:
+                            seen.add(r['path'])
+                            unique_results.append(r)
+
+        unique_results.sort(key=lambda x: x['modified'], reverse=True)
+        self._cache[cache_key] = (token, unique_results)
+        return list(unique_results)
+
+    def _root_token(self, root: Path) -> Optional[Tuple[Any, ...]]:
+        """Summarize a search root's top level for change detection, or None if it can't be read."""
+        # CLAUDE.md files in the root plus the newest mtime of the directories the
+        # walk descends into: a file added one level down touches its directory,
+        # while dotfile churn in the root (e.g. $HOME) is ignored
+        files = []
+        latest_dir_mtime = 0
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.name in self.CLAUDE_MD_NAMES:
+                        files.append((entry.name, entry.stat().st_mtime_ns))
+                    elif (not entry.name.startswith('.')
+                          and entry.name not in self.SKIP_DIRS
+                          and entry.is_dir(follow_symlinks=False)):
+                        latest_dir_mtime = max(latest_dir_mtime, entry.stat(follow_symlinks=False).st_mtime_ns)
+        except OSError:
+            return None
+        return (str(root), tuple(sorted(files)), latest_dir_mtime)
+
+    def _find_files(self, root: Path, max_depth: int) -> List[Dict[str, Any]]:
+        """Walk a directory tree and collect CLAUDE.md files."""
+        results = []
+        stack = [(str(root), 0)]
+
+        while stack:
+            directory, depth = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    matched = False
+                    for count, entry in enumerate(entries, 1):
+                        if count > self.MAX_DIR_ENTRIES and not matched:
+                            break
+                        if entry.name in self.CLAUDE_MD_NAMES and entry.is_file():
+                            matched = True
+                            stat = entry.stat()
+                            results.append({
+                                'path': entry.path,
+                                'name': entry.name,
+                                'project': os.path.basename(directory),
+                                'project_path': directory,
+                                'size': stat.st_size,
+                                'modified': datetime.fromtimestamp(stat.st_mtime),
+                                'is_local': entry.name == 'CLAUDE.local.md'
+                            })
+                        elif (depth < max_depth
+                              and not entry.name.startswith('.')
+                              and entry.name not in self.SKIP_DIRS
+                              and entry.is_dir(follow_symlinks=False)):
+                            stack.append((entry.path, depth + 1))
+            except OSError:
+                pass
+
+        return results
+
+    def read_claude_md(self, file_path: str) -> Optional[str]:
+        """Read content of a CLAUDE.md file."""
+        key = str(file_path)
+        signature = file_signature(Path(key))
+        if signature is None:
+            self._read_cache.pop(key, None)
+            return None
+
+        cached = self._read_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            self._read_cache.move_to_end(key)
+            return cached[1]
+
+        try:
+            with open(key, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except IOError:
+            return None
+
+        self._read_cache[key] = (signature, content)
+        self._read_cache.move_to_end(key)
+        if len(self._read_cache) > self.READ_CACHE_SIZE:
+            self._read_cache.popitem(last=False)
+        return content
+
+    def write_claude_md(self, file_path: str, content: str) -> bool:
+        """Write content to a CLAUDE.md file."""
+        try:
+            # Create backup
+            path = Path(file_path)
+            self._read_cache.pop(str(file_path), None)
+            if path.exists():
+                shutil.copyfile(path, path.with_suffix('.md.backup'))
+
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            self._cache.clear()
+            return True
+        except IOError:
+            return False
+
+    def create_claude_md(self, project_path: str, content: str = "", local: bool = False) -> Optional[str]:
+        """Create a new CLAUDE.md file in a project."""
+        filename = 'CLAUDE.local.md' if local else 'CLAUDE.md'
+        file_path = Path(project_path) / filename
+
+        if file_path.exists():
+            return None  # Already exists
+
+        try:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content or self.get_template())
+            self._cache.clear()
+            return str(file_path)
+        except IOError:
+            return None
+
+    def delete_claude_md(self, file_path: str) -> bool:
+        """Delete a CLAUDE.md file (moves to backup)."""
+        self._read_cache.pop(str(file_path), None)
+        try:
+            path = Path(file_path)
+            if path.exists():
+                backup_path = path.with_suffix('.md.deleted')
+                path.rename(backup_path)
+                self._cache.clear()
+                return True
+        except IOError:
+            pass
+        return False
+
+    def get_template(self, template_name: str = "default") -> str:
+        """Get a CLAUDE.md template."""
+        return _TEMPLATES.get(template_name, _TEMPLATES["default"])
 
     def get_available_templates(self) -> List[Dict[str, str]]:
         """Get list of available templates."""
-        return [
-            {"name": "default", "description": "General purpose template"},
-            {"name": "python", "description": "Python project template"},
-            {"name": "javascript", "description": "JavaScript/Node.js template"},
-            {"name": "react", "description": "React application template"},
-            {"name": "minimal", "description": "Minimal template"}
-        ]
+        return list(_AVAILABLE_TEMPLATES)
 
     def analyze_claude_md(self, content: str) -> Dict[str, Any]:
         """Analyze a CLAUDE.md file content."""
         lines = content.split('\n')
+        word_count = 0
+        has_code_blocks = False
+        has_links = False
+        sections = []
+        headings = []
 
-        analysis = {
-            'total_lines': len(lines),
-            'word_count': len(content.split()),
-            'sections': [],
-            'has_code_blocks': '```' in content,
-            'has_links': 'http' in content.lower() or '[' in content,
-            'headings': []
-        }
-
+        # Collect every metric in one pass over the lines
         for line in lines:
+            word_count += len(line.split())
+            if not has_code_blocks and '```' in line:
+                has_code_blocks = True
+            if not has_links and ('[' in line or 'http' in line.lower()):
+                has_links = True
+
             line = line.strip()
             if line.startswith('#'):
                 level = len(line) - len(line.lstrip('#'))
                 heading = line.lstrip('#').strip()
-                analysis['headings'].append({
+                headings.append({
                     'level': level,
                     'text': heading
                 })
                 if level == 2:
-                    analysis['sections'].append(heading)
+                    sections.append(heading)
+
+        analysis = {
+            'total_lines': len(lines),
+            'word_count': word_count,
+            'sections': sections,
+            'has_code_blocks': has_code_blocks,
+            'has_links': has_links,
+            'headings': headings
+        }
 
         return analysis
 
@@ -317,23 +411,42 @@ Key information for Claude to know about this project.
             files = self.find_claude_md_files()
 
         results = []
-        query_lower = query.lower()
+        query_folded = query.casefold()
 
         for file_info in files:
             content = self.read_claude_md(file_info['path'])
-            if content and query_lower in content.lower():
-                # Find matching lines
-                matches = []
-                for i, line in enumerate(content.split('\n'), 1):
-                    if query_lower in line.lower():
-                        matches.append({
-                            'line_number': i,
-                            'content': line.strip()[:200]
-                        })
-
-                results.append({
-                    **file_info,
-                    'matches': matches[:5]  # Limit to 5 matches per file
+            if not content:
+                continue
+
+            folded = content.casefold()
+            pos = folded.find(query_folded)
+            if pos < 0:
+                continue
+
+            # Only files with a hit are split into lines
+            lines = content.split('\n')
+            matches = []
+            line_number = 1
+            scanned = 0
+            while pos != -1:
+                line_start = folded.rfind('\n', 0, pos) + 1
+                line_number += folded.count('\n', scanned, line_start)
+                scanned = line_start
+                matches.append({
+                    'line_number': line_number,
+                    'content': lines[line_number - 1].strip()[:200]
                 })
+                if len(matches) >= 5:  # Limit to 5 matches per file
+                    break
+
+                line_end = folded.find('\n', pos)
+                if line_end == -1:
+                    break
+                pos = folded.find(query_folded, line_end + 1)
+
+            results.append({
+                **file_info,
+                'matches': matches
+            })
 
         return results
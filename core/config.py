@@ -4,8 +4,65 @@ Configuration management for Claude Code Manager.
 
 import os
 import json
+from dataclasses import is_dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+# Resolved once at import; neither changes while the app is running
+HOME_DIR = Path.home()
+IS_WINDOWS = os.name == 'nt'
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _model_default(obj: Any) -> Any:
+    """Encode a model dataclass through its to_dict() for the stdlib json module."""
+    if is_dataclass(obj) and hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON text (compact, or 2-space indented), using orjson when it is installed.
+
+    orjson encodes dataclasses and datetimes natively, field by field, so only
+    pass models whose to_dict() writes every field unchanged (Agent, Checkpoint).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    # Like orjson, leave non-ASCII text unescaped; callers write UTF-8
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_model_default)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_model_default)
+
+
+def file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def atomic_write(path: Path, text: str) -> None:
+    """Write text to a file via a temp file and os.replace, so readers never see it half-written."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 
 class Config:
@@ -23,21 +80,20 @@ class Config:
         self.history_file = self.claude_dir / "history.jsonl"
 
         # Claude Desktop config path
-        if os.name == 'nt':  # Windows
+        if IS_WINDOWS:
             appdata = os.environ.get('APPDATA', '')
             self.claude_desktop_config = Path(appdata) / "Claude" / "claude_desktop_config.json"
         else:  # macOS/Linux
-            self.claude_desktop_config = Path.home() / ".config" / "claude" / "claude_desktop_config.json"
+            self.claude_desktop_config = HOME_DIR / ".config" / "claude" / "claude_desktop_config.json"
 
-        self._settings: Optional[Dict[str, Any]] = None
-        self._config: Optional[Dict[str, Any]] = None
+        # Parsed JSON files keyed by path, valid while the file signature matches
+        self._json_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
 
     def _find_claude_dir(self) -> Path:
         """Find the .claude directory."""
         # Check common locations
-        home = Path.home()
         possible_paths = [
-            home / ".claude",
+            HOME_DIR / ".claude",
             Path(os.environ.get('USERPROFILE', '')) / ".claude",
         ]
 
@@ -46,38 +102,50 @@ class Config:
                 return path
 
         # Default to home directory
-        return home / ".claude"
+        return HOME_DIR / ".claude"
 
     @property
     def settings(self) -> Dict[str, Any]:
         """Load and return settings."""
-        if self._settings is None:
-            self._settings = self._load_json(self.settings_file, {})
-        return self._settings
+        return self._load_json_cached(self.settings_file, {})
 
     @property
     def config(self) -> Dict[str, Any]:
         """Load and return config."""
-        if self._config is None:
-            self._config = self._load_json(self.config_file, {})
-        return self._config
+        return self._load_json_cached(self.config_file, {})
 
     def _load_json(self, path: Path, default: Any = None) -> Any:
         """Load JSON from file."""
         try:
             if path.exists():
-                with open(path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(path, 'rb') as f:
+                    return json_loads(f.read())
         except (json.JSONDecodeError, IOError):
             pass
         return default if default is not None else {}
 
+    def _load_json_cached(self, path: Path, default: Any = None) -> Any:
+        """Load JSON from file, reusing the last parse until the file changes."""
+        signature = file_signature(path)
+        if signature is None:
+            self._json_cache.pop(path, None)
+            return default if default is not None else {}
+
+        entry = self._json_cache.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        data = self._load_json(path, default)
+        self._json_cache[path] = (signature, data)
+        return data
+
     def save_settings(self, settings: Dict[str, Any]) -> bool:
         """Save settings to file."""
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2)
-            self._settings = settings
+            atomic_write(self.settings_file, json.dumps(settings, indent=2))
+            signature = file_signature(self.settings_file)
+            if signature is not None:
+                self._json_cache[self.settings_file] = (signature, settings)
             return True
         except IOError:
             return False
@@ -93,13 +161,13 @@ class Config:
 
     def get_stats_cache(self) -> Dict[str, Any]:
         """Load stats cache."""
-        return self._load_json(self.stats_cache_file, {})
+        return self._load_json_cached(self.stats_cache_file, {})
 
     def get_installed_plugins(self) -> Dict[str, Any]:
         """Load installed plugins."""
         plugins_file = self.plugins_dir / "installed_plugins.json"
-        return self._load_json(plugins_file, {"plugins": {}})
+        return self._load_json_cached(plugins_file, {"plugins": {}})
 
     def get_claude_desktop_mcp_config(self) -> Dict[str, Any]:
         """Load Claude Desktop MCP configuration."""
-        return self._load_json(self.claude_desktop_config, {"mcpServers": {}})
+        return self._load_json_cached(self.claude_desktop_config, {"mcpServers": {}})
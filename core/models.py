@@ -2,13 +2,50 @@
 Data models for Claude Code Manager.
 """
 
+import sys
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Mapping, NamedTuple, TextIO
 
+from .config import json_loads
 
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # optional, falls back to datetime.fromisoformat
+    if sys.version_info >= (3, 11):
+        # fromisoformat accepts a trailing 'Z' from 3.11 on
+        _parse_iso = datetime.fromisoformat
+    else:
+        def _parse_iso(value: str) -> datetime:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# Session record types that become Message objects
+_MESSAGE_TYPES = frozenset(('user', 'assistant'))
+# Stand-in for a record without a "message" object
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _slotted(cls: type) -> type:
+    """Rebuild a dataclass with __slots__ for its fields, like dataclass(slots=True) on 3.10+."""
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    # Defaults live on in the generated __init__; as class attributes they'd shadow the slots
+    for name in names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _iso(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp, or return None for a missing one."""
+    return _parse_iso(value) if value else None
+
+
+@_slotted
 @dataclass
 class Session:
     """Represents a Claude Code session."""
@@ -22,6 +59,15 @@ class Session:
     git_branch: Optional[str] = None
     project_path: Optional[str] = None
     is_sidechain: bool = False
+    # Lowercased copies of the searched fields, so live search needn't redo them
+    _lc_summary: str = field(default='', init=False, repr=False, compare=False)
+    _lc_first_prompt: str = field(default='', init=False, repr=False, compare=False)
+    _lc_session_id: str = field(default='', init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._lc_summary = self.summary.lower()
+        self._lc_first_prompt = self.first_prompt.lower()
+        self._lc_session_id = self.session_id.lower()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Session':
@@ -32,8 +78,8 @@ class Session:
             first_prompt=data.get('firstPrompt', 'No prompt'),
             summary=data.get('summary', ''),
             message_count=data.get('messageCount', 0),
-            created=datetime.fromisoformat(data.get('created', '').replace('Z', '+00:00')) if data.get('created') else datetime.now(timezone.utc),
-            modified=datetime.fromisoformat(data.get('modified', '').replace('Z', '+00:00')) if data.get('modified') else datetime.now(timezone.utc),
+            created=_iso(data.get('created')) or datetime.now(timezone.utc),
+            modified=_iso(data.get('modified')) or datetime.now(timezone.utc),
             git_branch=data.get('gitBranch'),
             project_path=data.get('projectPath'),
             is_sidechain=data.get('isSidechain', False)
@@ -47,14 +93,19 @@ class Project:
     path: Path
     original_path: str
     sessions: List[Session] = field(default_factory=list)
+    # Most recent session modification time, set by load_sessions()
+    last_modified: datetime = datetime.min.replace(tzinfo=timezone.utc)
+
+    def __post_init__(self):
+        self._lc_name = self.name.lower()
 
     def load_sessions(self) -> None:
         """Load sessions from sessions-index.json."""
         index_file = self.path / "sessions-index.json"
         if index_file.exists():
             try:
-                with open(index_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(index_file, 'rb') as f:
+                    data = json_loads(f.read())
                     self.original_path = data.get('originalPath', self.original_path)
                     self.sessions = [
                         Session.from_dict(entry)
@@ -63,7 +114,26 @@ class Project:
             except (json.JSONDecodeError, IOError):
                 pass
 
+        self.last_modified = max(
+            (s.modified for s in self.sessions),
+            default=datetime.min.replace(tzinfo=timezone.utc)
+        )
+
 
+class SearchHit(NamedTuple):
+    """A session matched by SessionManager.search_sessions."""
+    project: Project
+    session: Session
+    match_type: str  # summary, prompt
+
+
+class RecentHit(NamedTuple):
+    """A session listed by SessionManager.get_recent_sessions."""
+    project: Project
+    session: Session
+
+
+@_slotted
 @dataclass
 class Message:
     """Represents a message in a session."""
@@ -78,20 +148,25 @@ class Message:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Optional['Message']:
         """Create Message from dictionary."""
-        if data.get('type') not in ['user', 'assistant']:
+        message_type = data.get('type')
+        if message_type not in _MESSAGE_TYPES:
             return None
 
-        message_data = data.get('message', {})
+        message_data = data.get('message') or _EMPTY
+        content = message_data.get('content', '')
+        if content.__class__ is not str:
+            content = str(content)
         return cls(
             uuid=data.get('uuid', ''),
             role=message_data.get('role', ''),
-            content=message_data.get('content', '') if isinstance(message_data.get('content'), str) else str(message_data.get('content', '')),
-            timestamp=datetime.fromisoformat(data.get('timestamp', '').replace('Z', '+00:00')) if data.get('timestamp') else datetime.now(timezone.utc),
-            type=data.get('type', ''),
+            content=content,
+            timestamp=_iso(data.get('timestamp')) or datetime.now(timezone.utc),
+            type=message_type,
             parent_uuid=data.get('parentUuid')
         )
 
 
+@_slotted
 @dataclass
 class Agent:
     """Represents a custom Claude Code agent."""
@@ -117,21 +192,47 @@ class Agent:
             'run_count': self.run_count
         }
 
+    def write_json(self, fp: TextIO, indent: bool = False) -> None:
+        """Write the to_dict() JSON to a text file field by field, compact or 2-space indented."""
+        fields = (
+            ('name', self.name),
+            ('description', self.description),
+            ('system_prompt', self.system_prompt),
+            ('model', self.model),
+            ('temperature', self.temperature),
+            ('created', self.created.isoformat()),
+            ('last_used', self.last_used.isoformat() if self.last_used else None),
+            ('run_count', self.run_count),
+        )
+        separator, colon = (',\n  ', ': ') if indent else (',', ':')
+        fp.write('{\n  ' if indent else '{')
+        for i, (key, value) in enumerate(fields):
+            if i:
+                fp.write(separator)
+            fp.write(f'"{key}"{colon}')
+            fp.write(json.dumps(value, ensure_ascii=False))
+        fp.write('\n}' if indent else '}')
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Agent':
         """Create Agent from dictionary."""
-        return cls(
-            name=data.get('name', ''),
-            description=data.get('description', ''),
-            system_prompt=data.get('system_prompt', ''),
-            model=data.get('model', 'claude-sonnet-4-20250514'),
-            temperature=data.get('temperature', 1.0),
-            created=datetime.fromisoformat(data.get('created', datetime.now().isoformat())),
-            last_used=datetime.fromisoformat(data['last_used']) if data.get('last_used') else None,
-            run_count=data.get('run_count', 0)
-        )
+        agent = cls(name='', description='', system_prompt='')
+        agent.update_from_dict(data)
+        return agent
+
+    def update_from_dict(self, data: Dict[str, Any]) -> None:
+        """Overwrite fields in place from dictionary."""
+        self.name = data.get('name', '')
+        self.description = data.get('description', '')
+        self.system_prompt = data.get('system_prompt', '')
+        self.model = data.get('model', 'claude-sonnet-4-20250514')
+        self.temperature = data.get('temperature', 1.0)
+        self.created = _iso(data.get('created')) or datetime.now()
+        self.last_used = _iso(data.get('last_used'))
+        self.run_count = data.get('run_count', 0)
 
 
+@_slotted
 @dataclass
 class AgentRun:
     """Represents an agent execution run."""
@@ -144,6 +245,8 @@ class AgentRun:
     status: str = "running"  # running, completed, failed
     tokens_used: int = 0
     error: Optional[str] = None
+    # Sidecar file holding the response, relative to the agents data directory
+    response_path: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -151,7 +254,8 @@ class AgentRun:
             'run_id': self.run_id,
             'agent_name': self.agent_name,
             'prompt': self.prompt,
-            'response': self.response,
+            'response': '' if self.response_path else self.response,
+            'response_path': self.response_path,
             'started': self.started.isoformat(),
             'completed': self.completed.isoformat() if self.completed else None,
             'status': self.status,
@@ -167,14 +271,16 @@ class AgentRun:
             agent_name=data.get('agent_name', ''),
             prompt=data.get('prompt', ''),
             response=data.get('response', ''),
-            started=datetime.fromisoformat(data.get('started', datetime.now().isoformat())),
-            completed=datetime.fromisoformat(data['completed']) if data.get('completed') else None,
+            started=_iso(data.get('started')) or datetime.now(),
+            completed=_iso(data.get('completed')),
             status=data.get('status', 'running'),
             tokens_used=data.get('tokens_used', 0),
-            error=data.get('error')
+            error=data.get('error'),
+            response_path=data.get('response_path')
         )
 
 
+@_slotted
 @dataclass
 class MCPServer:
     """Represents an MCP server configuration."""
@@ -206,6 +312,7 @@ class MCPServer:
         )
 
 
+@_slotted
 @dataclass
 class Checkpoint:
     """Represents a session checkpoint."""
@@ -239,7 +346,7 @@ class Checkpoint:
             session_id=data.get('session_id', ''),
             name=data.get('name', ''),
             description=data.get('description', ''),
-            timestamp=datetime.fromisoformat(data.get('timestamp', datetime.now().isoformat())),
+            timestamp=_iso(data.get('timestamp')) or datetime.now(),
             message_uuid=data.get('message_uuid', ''),
             parent_checkpoint_id=data.get('parent_checkpoint_id'),
             branch_name=data.get('branch_name')
@@ -2,147 +2,253 @@
 Session management for Claude Code Manager.
 """
 
+import os
 import json
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 
-from .config import Config
-from .models import Project, Session, Message
+from .config import Config, file_signature, json_loads
+from .models import Project, Session, Message, SearchHit, RecentHit
+
+
+def _may_be_message(line: bytes) -> bool:
+    """Whether a session log line can hold a message."""
+    # Only user/assistant records become messages, and each of those names
+    # its type, so lines mentioning neither are dropped before parsing
+    return b'"user"' in line or b'"assistant"' in line
 
 
 class SessionManager:
     """Manages Claude Code sessions and projects."""
 
+    # Upper bound on threads loading project session indexes
+    MAX_LOAD_WORKERS = 16
+    # Bytes read per step when tailing history.jsonl
+    HISTORY_BLOCK_SIZE = 64 * 1024
+
     def __init__(self, config: Config):
         self.config = config
         self._projects_cache: Optional[List[Project]] = None
+        # Loaded projects by directory, with the sessions-index.json signature they were read at
+        self._project_entries: Dict[Path, Tuple[Optional[Tuple[int, int]], Project]] = {}
+        # Trigram index for search_sessions, built from _search_index_source
+        self._search_index: Optional[Tuple[List[Tuple[Project, Session]], Dict[str, Set[int]]]] = None
+        self._search_index_source: Optional[List[Project]] = None
+        # Decoded project names by directory name; the encoding never changes
+        self._project_names: Dict[str, str] = {}
 
     def get_projects(self, force_refresh: bool = False) -> List[Project]:
         """Get all projects with their sessions."""
-        if self._projects_cache is not None and not force_refresh:
+        project_dirs = []
+        if self.config.projects_dir.exists():
+            project_dirs = [item for item in self.config.projects_dir.iterdir() if item.is_dir()]
+
+        # Only projects whose sessions-index.json changed since they were loaded are rebuilt
+        entries = {}
+        stale = []
+        for project_dir in project_dirs:
+            signature = file_signature(project_dir / "sessions-index.json")
+            cached = self._project_entries.get(project_dir)
+            if cached is not None and cached[0] == signature:
+                entries[project_dir] = cached
+            else:
+                stale.append((project_dir, signature))
+
+        if (self._projects_cache is not None and not force_refresh
+                and not stale and len(entries) == len(self._project_entries)):
             return self._projects_cache
 
-        projects = []
-        if self.config.projects_dir.exists():
-            for item in self.config.projects_dir.iterdir():
-                if item.is_dir():
-                    # Parse project name from directory name
-                    name = self._parse_project_name(item.name)
-                    project = Project(
-                        name=name,
-                        path=item,
-                        original_path=name
-                    )
-                    project.load_sessions()
-                    projects.append(project)
+        # Each project reads its own index file, so load them in parallel
+        if stale:
+            workers = min(self.MAX_LOAD_WORKERS, (os.cpu_count() or 1) * 2, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                built = executor.map(self._build_project, [project_dir for project_dir, _ in stale])
+                for (project_dir, signature), project in zip(stale, built):
+                    entries[project_dir] = (signature, project)
+
+        self._project_entries = entries
+        projects = [entries[project_dir][1] for project_dir in project_dirs]
 
         # Sort by most recent session
-        projects.sort(
-            key=lambda p: max(
-                (s.modified for s in p.sessions),
-                default=datetime.min.replace(tzinfo=timezone.utc)
-            ),
-            reverse=True
-        )
+        projects.sort(key=attrgetter('last_modified'), reverse=True)
 
         self._projects_cache = projects
         return projects
 
+    def _build_project(self, project_dir: Path) -> Project:
+        """Create a project for a project directory and load its sessions."""
+        # Parse project name from directory name
+        name = self._parse_project_name(project_dir.name)
+        project = Project(
+            name=name,
+            path=project_dir,
+            original_path=name
+        )
+        project.load_sessions()
+        return project
+
     def _parse_project_name(self, dir_name: str) -> str:
         """Parse project name from directory name."""
+        name = self._project_names.get(dir_name)
+        if name is not None:
+            return name
+
         # Convert encoded path back to readable format
         # e.g., "D--github-repos-personal-my-portfolio" -> "D:/github-repos-personal/my-portfolio"
         if dir_name.startswith('-'):
             # Unix-style path
-            return '/' + dir_name[1:].replace('-', '/')
+            name = '/' + dir_name[1:].replace('-', '/')
         elif len(dir_name) > 2 and dir_name[1:3] == '--':
             # Windows-style path (e.g., "D--")
-            return dir_name[0] + ':/' + dir_name[3:].replace('-', '/')
-        return dir_name.replace('-', '/')
+            name = dir_name[0] + ':/' + dir_name[3:].replace('-', '/')
+        else:
+            name = dir_name.replace('-', '/')
+        self._project_names[dir_name] = name
+        return name
 
     def get_session_messages(self, session_path: str) -> List[Message]:
         """Load messages from a session file."""
+        path = Path(session_path)
+
+        if not path.exists():
+            return []
+
+        try:
+            raw = path.read_bytes()
+        except IOError:
+            return []
+
+        lines = [line for line in raw.split(b'\n') if _may_be_message(line)]
+        try:
+            # Parse the whole log as one JSON array in a single call
+            records = json_loads(b'[' + b','.join(lines) + b']')
+        except json.JSONDecodeError:
+            # A malformed line spoils the bulk parse, so skip bad lines individually
+            records = []
+            for line in lines:
+                try:
+                    records.append(json_loads(line))
+                except json.JSONDecodeError:
+                    continue
+
         messages = []
+        for data in records:
+            msg = Message.from_dict(data)
+            if msg:
+                messages.append(msg)
+        return messages
+
+    def iter_session_messages(self, session_path: str) -> Iterator[Message]:
+        """Yield messages from a session file one at a time, reading it line by line."""
         path = Path(session_path)
 
         if not path.exists():
-            return messages
+            return
 
         try:
-            with open(path, 'r', encoding='utf-8') as f:
+            with open(path, 'rb') as f:
                 for line in f:
-                    line = line.strip()
-                    if not line:
+                    if not _may_be_message(line):
                         continue
                     try:
-                        data = json.loads(line)
-                        msg = Message.from_dict(data)
-                        if msg:
-                            messages.append(msg)
+                        data = json_loads(line)
                     except json.JSONDecodeError:
                         continue
+                    msg = Message.from_dict(data)
+                    if msg:
+                        yield msg
         except IOError:
-            pass
+            return
 
-        return messages
-
-    def search_sessions(self, query: str) -> List[Dict[str, Any]]:
+    def search_sessions(self, query: str) -> List[SearchHit]:
         """Search sessions by query."""
         results = []
         query_lower = query.lower()
 
-        for project in self.get_projects():
-            for session in project.sessions:
-                # Search in summary, first prompt, and session ID
-                if (query_lower in session.summary.lower() or
-                    query_lower in session.first_prompt.lower() or
-                    query_lower in session.session_id.lower() or
-                    query_lower in project.name.lower()):
-                    results.append({
-                        'project': project,
-                        'session': session,
-                        'match_type': 'summary' if query_lower in session.summary.lower() else 'prompt'
-                    })
+        entries, index = self._get_search_index()
+        if len(query_lower) < 3:
+            candidates = range(len(entries))
+        else:
+            # Only sessions containing every trigram of the query can match
+            postings = [index.get(t) for t in {query_lower[i:i + 3] for i in range(len(query_lower) - 2)}]
+            if not all(postings):
+                return results
+            postings.sort(key=len)
+            candidates = sorted(set.intersection(*postings))
+
+        for entry_id in candidates:
+            project, session = entries[entry_id]
+            # Search in summary, first prompt, and session ID
+            summary_match = query_lower in session._lc_summary
+            if (summary_match or
+                query_lower in session._lc_first_prompt or
+                query_lower in session._lc_session_id or
+                query_lower in project._lc_name):
+                results.append(SearchHit(project, session, 'summary' if summary_match else 'prompt'))
 
         return results
 
+    def _get_search_index(self) -> Tuple[List[Tuple[Project, Session]], Dict[str, Set[int]]]:
+        """Get (project, session) entries and a trigram -> entry ids index over their searched fields."""
+        projects = self.get_projects()
+        if self._search_index is None or self._search_index_source is not projects:
+            entries: List[Tuple[Project, Session]] = []
+            index: Dict[str, Set[int]] = {}
+            for project in projects:
+                for session in project.sessions:
+                    entry_id = len(entries)
+                    entries.append((project, session))
+                    trigrams = set()
+                    for text in (session._lc_summary, session._lc_first_prompt,
+                                 session._lc_session_id, project._lc_name):
+                        trigrams.update(text[i:i + 3] for i in range(len(text) - 2))
+                    for trigram in trigrams:
+                        index.setdefault(trigram, set()).add(entry_id)
+            self._search_index = (entries, index)
+            self._search_index_source = projects
+        return self._search_index
+
     def get_session_stats(self, session: Session) -> Dict[str, Any]:
         """Get statistics for a session."""
-        messages = self.get_session_messages(session.full_path)
+        total = user_count = assistant_count = assistant_chars = 0
+        start = end = None
 
-        user_messages = [m for m in messages if m.role == 'user']
-        assistant_messages = [m for m in messages if m.role == 'assistant']
+        # Fold every statistic in one pass without keeping the messages
+        for m in self.iter_session_messages(session.full_path):
+            total += 1
+            if m.role == 'user':
+                user_count += 1
+            elif m.role == 'assistant':
+                assistant_count += 1
+                assistant_chars += len(m.content)
+            if start is None or m.timestamp < start:
+                start = m.timestamp
+            if end is None or m.timestamp > end:
+                end = m.timestamp
 
         # Calculate duration
-        if messages:
-            start = min(m.timestamp for m in messages)
-            end = max(m.timestamp for m in messages)
-            duration = (end - start).total_seconds()
-        else:
-            duration = 0
+        duration = (end - start).total_seconds() if total else 0
 
         return {
-            'total_messages': len(messages),
-            'user_messages': len(user_messages),
-            'assistant_messages': len(assistant_messages),
+            'total_messages': total,
+            'user_messages': user_count,
+            'assistant_messages': assistant_count,
             'duration_seconds': duration,
-            'avg_response_length': sum(len(m.content) for m in assistant_messages) / max(len(assistant_messages), 1)
+            'avg_response_length': assistant_chars / max(assistant_count, 1)
         }
 
-    def get_recent_sessions(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_recent_sessions(self, limit: int = 10) -> List[RecentHit]:
         """Get most recent sessions across all projects."""
         all_sessions = []
 
         for project in self.get_projects():
             for session in project.sessions:
-                all_sessions.append({
-                    'project': project,
-                    'session': session
-                })
+                all_sessions.append(RecentHit(project, session))
 
         # Sort by modified date
-        all_sessions.sort(key=lambda x: x['session'].modified, reverse=True)
+        all_sessions.sort(key=lambda x: x.session.modified, reverse=True)
 
         return all_sessions[:limit]
 
@@ -152,16 +258,27 @@ class SessionManager:
 
         if self.config.history_file.exists():
             try:
-                with open(self.config.history_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            data = json.loads(line)
-                            history.append(data)
-                        except json.JSONDecodeError:
-                            continue
+                with open(self.config.history_file, 'rb') as f:
+                    # Entries are appended as commands run, so read blocks back from
+                    # the end and stop once enough entries are found
+                    position = f.seek(0, os.SEEK_END)
+                    partial = b''
+                    while position > 0 and len(history) < limit:
+                        size = min(self.HISTORY_BLOCK_SIZE, position)
+                        position -= size
+                        f.seek(position)
+                        lines = (f.read(size) + partial).split(b'\n')
+                        # The first line may continue in the previous block
+                        partial = lines.pop(0) if position > 0 else b''
+                        for line in reversed(lines):
+                            if not line.strip():
+                                continue
+                            try:
+                                history.append(json_loads(line))
+                            except json.JSONDecodeError:
+                                continue
+                            if len(history) >= limit:
+                                break
             except IOError:
                 pass
 
@@ -172,3 +289,5 @@ class SessionManager:
     def clear_cache(self) -> None:
         """Clear the projects cache."""
         self._projects_cache = None
+        self._search_index = None
+        self._search_index_source = None
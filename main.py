@@ -10,47 +10,69 @@ from pathlib import Path
 # Add the app directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QPalette, QColor
+# PyQt and the window modules are imported in main(), so importing this
+# module (e.g. from a launcher) stays cheap
+from ui.styles import minify_stylesheet
 
-from ui.main_window import MainWindow
-from core.config import Config
 
+# (role, color) pairs for the dark palette, built on first use
+_DARK_ROLES = None
 
-def setup_dark_palette(app: QApplication) -> None:
+
+def setup_dark_palette(app: 'QApplication') -> None:
     """Configure dark mode palette for the application."""
-    palette = QPalette()
+    from PyQt5.QtGui import QPalette, QColor
+
+    global _DARK_ROLES
+    if _DARK_ROLES is None:
+        _DARK_ROLES = (
+            # Base colors
+            (QPalette.Window, QColor(30, 30, 30)),
+            (QPalette.WindowText, QColor(220, 220, 220)),
+            (QPalette.Base, QColor(25, 25, 25)),
+            (QPalette.AlternateBase, QColor(35, 35, 35)),
+            (QPalette.ToolTipBase, QColor(50, 50, 50)),
+            (QPalette.ToolTipText, QColor(220, 220, 220)),
+            (QPalette.Text, QColor(220, 220, 220)),
+            (QPalette.Button, QColor(45, 45, 45)),
+            (QPalette.ButtonText, QColor(220, 220, 220)),
+            (QPalette.BrightText, QColor(255, 255, 255)),
+            (QPalette.Link, QColor(100, 149, 237)),
+            (QPalette.Highlight, QColor(100, 100, 180)),
+            (QPalette.HighlightedText, QColor(255, 255, 255)),
+        )
 
-    # Base colors
-    palette.setColor(QPalette.Window, QColor(30, 30, 30))
-    palette.setColor(QPalette.WindowText, QColor(220, 220, 220))
-    palette.setColor(QPalette.Base, QColor(25, 25, 25))
-    palette.setColor(QPalette.AlternateBase, QColor(35, 35, 35))
-    palette.setColor(QPalette.ToolTipBase, QColor(50, 50, 50))
-    palette.setColor(QPalette.ToolTipText, QColor(220, 220, 220))
-    palette.setColor(QPalette.Text, QColor(220, 220, 220))
-    palette.setColor(QPalette.Button, QColor(45, 45, 45))
-    palette.setColor(QPalette.ButtonText, QColor(220, 220, 220))
-    palette.setColor(QPalette.BrightText, QColor(255, 255, 255))
-    palette.setColor(QPalette.Link, QColor(100, 149, 237))
-    palette.setColor(QPalette.Highlight, QColor(100, 100, 180))
-    palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
+    palette = QPalette()
+    for role, color in _DARK_ROLES:
+        palette.setColor(role, color)
 
     # Disabled colors
-    palette.setColor(QPalette.Disabled, QPalette.WindowText, QColor(128, 128, 128))
-    palette.setColor(QPalette.Disabled, QPalette.Text, QColor(128, 128, 128))
-    palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(128, 128, 128))
+    disabled_gray = QColor(128, 128, 128)
+    for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+        palette.setColor(QPalette.Disabled, role, disabled_gray)
 
     app.setPalette(palette)
 
 
 def main():
     """Main entry point for the application."""
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QFont, QPalette
+
+    from ui.main_window import MainWindow
+    from core.config import Config
+
     # Enable High DPI scaling
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
+    # Share one GL context across widgets, merge bursts of input events and
+    # avoid creating native windows for siblings of native widgets
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.AA_DontCreateNativeWidgetSiblings, True)
+
     app = QApplication(sys.argv)
     app.setApplicationName("Claude Code Manager")
     app.setApplicationVersion("1.0.0")
@@ -60,11 +82,17 @@ def main():
     font = QFont("Segoe UI", 10)
     app.setFont(font)
 
-    # Apply dark palette
-    setup_dark_palette(app)
+    # A platform theme that is already dark only needs the accents;
+    # CCM_FORCE_DARK=1 applies the full theme regardless
+    native_dark = app.palette().color(QPalette.Window).lightness() < 80
+    if native_dark and os.environ.get('CCM_FORCE_DARK') != '1':
+        app.setStyleSheet(_ACCENT_STYLESHEET)
+    else:
+        # Apply dark palette
+        setup_dark_palette(app)
 
-    # Apply stylesheet
-    app.setStyleSheet(get_stylesheet())
+        # Apply stylesheet
+        app.setStyleSheet(_STYLESHEET)
 
     # Initialize configuration
     config = Config()
@@ -76,9 +104,9 @@ def main():
     sys.exit(app.exec_())
 
 
-def get_stylesheet() -> str:
-    """Return the application stylesheet."""
-    return """
+# Rules shared by most widgets; sheets for rarer widgets live in ui.styles
+# and are set on just those widgets. _STYLESHEET adds the accent rules below
+_STYLESHEET_RAW = """
     QMainWindow {
         background-color: #1e1e1e;
     }
@@ -94,24 +122,6 @@ def get_stylesheet() -> str:
         border-radius: 4px;
     }
 
-    QTabBar::tab {
-        background-color: #2d2d2d;
-        color: #dcdcdc;
-        padding: 10px 20px;
-        margin-right: 2px;
-        border-top-left-radius: 4px;
-        border-top-right-radius: 4px;
-    }
-
-    QTabBar::tab:selected {
-        background-color: #3d3d3d;
-        border-bottom: 2px solid #6495ed;
-    }
-
-    QTabBar::tab:hover:!selected {
-        background-color: #353535;
-    }
-
     QTreeWidget, QListWidget, QTableWidget {
         background-color: #252526;
         border: 1px solid #3d3d3d;
@@ -140,45 +150,6 @@ def get_stylesheet() -> str:
         border-right: 1px solid #3d3d3d;
     }
 
-    QPushButton {
-        background-color: #0e639c;
-        color: white;
-        border: none;
-        padding: 8px 16px;
-        border-radius: 4px;
-        font-weight: bold;
-    }
-
-    QPushButton:hover {
-        background-color: #1177bb;
-    }
-
-    QPushButton:pressed {
-        background-color: #094771;
-    }
-
-    QPushButton:disabled {
-        background-color: #3d3d3d;
-        color: #808080;
-    }
-
-    QPushButton[secondary="true"] {
-        background-color: #3d3d3d;
-        color: #dcdcdc;
-    }
-
-    QPushButton[secondary="true"]:hover {
-        background-color: #4d4d4d;
-    }
-
-    QPushButton[danger="true"] {
-        background-color: #c42b1c;
-    }
-
-    QPushButton[danger="true"]:hover {
-        background-color: #d43b2c;
-    }
-
     QLineEdit, QTextEdit, QPlainTextEdit {
         background-color: #3c3c3c;
         border: 1px solid #3d3d3d;
@@ -305,60 +276,89 @@ def get_stylesheet() -> str:
         background-color: #007acc;
         color: white;
     }
+    """
 
-    QProgressBar {
-        background-color: #3c3c3c;
-        border: none;
-        border-radius: 4px;
-        text-align: center;
-        color: white;
+
+# Accent rules for the header, tabs and buttons, the only part applied over a native dark theme
+_ACCENT_STYLESHEET_RAW = """
+    #header {
+        background-color: #252526;
+        border-bottom: 1px solid #3d3d3d;
+    }
+
+    #headerTitle {
+        font-size: 18px;
+        font-weight: bold;
+        color: #6495ed;
+    }
+
+    QTabBar::tab {
+        background-color: #2d2d2d;
+        color: #dcdcdc;
+        padding: 10px 20px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+
+    QTabBar::tab:selected {
+        background-color: #3d3d3d;
+        border-bottom: 2px solid #6495ed;
     }
 
-    QProgressBar::chunk {
+    QTabBar::tab:hover:!selected {
+        background-color: #353535;
+    }
+
+    QPushButton {
         background-color: #0e639c;
+        color: white;
+        border: none;
+        padding: 8px 16px;
         border-radius: 4px;
+        font-weight: bold;
     }
 
-    QCheckBox::indicator {
-        width: 18px;
-        height: 18px;
-        border-radius: 3px;
-        border: 1px solid #3d3d3d;
-        background-color: #3c3c3c;
+    QPushButton:hover {
+        background-color: #1177bb;
     }
 
-    QCheckBox::indicator:checked {
-        background-color: #0e639c;
-        border-color: #0e639c;
+    QPushButton:pressed {
+        background-color: #094771;
     }
 
-    QSpinBox, QDoubleSpinBox {
-        background-color: #3c3c3c;
-        border: 1px solid #3d3d3d;
-        border-radius: 4px;
-        padding: 6px;
+    QPushButton:disabled {
+        background-color: #3d3d3d;
+        color: #808080;
+    }
+
+    QPushButton[secondary="true"] {
+        background-color: #3d3d3d;
         color: #dcdcdc;
     }
 
-    QSlider::groove:horizontal {
-        height: 6px;
-        background-color: #3c3c3c;
-        border-radius: 3px;
+    QPushButton[secondary="true"]:hover {
+        background-color: #4d4d4d;
     }
 
-    QSlider::handle:horizontal {
-        width: 16px;
-        height: 16px;
-        margin: -5px 0;
-        background-color: #0e639c;
-        border-radius: 8px;
+    QPushButton[danger="true"] {
+        background-color: #c42b1c;
     }
 
-    QSlider::handle:horizontal:hover {
-        background-color: #1177bb;
+    QPushButton[danger="true"]:hover {
+        background-color: #d43b2c;
     }
     """
 
+# Minified once at import, so Qt's stylesheet parser sees fewer tokens
+_ACCENT_STYLESHEET = minify_stylesheet(_ACCENT_STYLESHEET_RAW)
+_STYLESHEET = minify_stylesheet(_STYLESHEET_RAW + _ACCENT_STYLESHEET_RAW)
+
+
+def get_stylesheet() -> str:
+    """Return the application stylesheet."""
+    return _STYLESHEET
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,23 @@
+"""
+About text for Claude Code Manager, shared by the About dialog and settings tab.
+"""
+
+ABOUT_HTML = """
+<h2>Claude Code Manager</h2>
+<p>Version 1.0.0</p>
+
+<p>A comprehensive GUI application for managing Claude Code sessions,
+custom agents, usage analytics, and more.</p>
+
+<h3>Features:</h3>
+<ul>
+    <li>Project & Session Management</li>
+    <li>Custom AI Agents</li>
+    <li>Usage Analytics Dashboard</li>
+    <li>MCP Server Management</li>
+    <li>Timeline & Checkpoints</li>
+    <li>CLAUDE.md File Management</li>
+</ul>
+
+<p>Built with PyQt5</p>
+"""
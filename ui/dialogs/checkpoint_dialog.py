@@ -10,6 +10,9 @@ from PyQt5.QtWidgets import (
 class CheckpointDialog(QDialog):
     """Dialog for creating checkpoints."""
 
+    MAX_NAME_LENGTH = 128
+    MAX_DESCRIPTION_LENGTH = 512
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Create Checkpoint")
@@ -21,10 +24,12 @@ class CheckpointDialog(QDialog):
 
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Enter checkpoint name")
+        self.name_input.setMaxLength(self.MAX_NAME_LENGTH)
         form.addRow("Name:", self.name_input)
 
         self.description_input = QLineEdit()
         self.description_input.setPlaceholderText("Optional description")
+        self.description_input.setMaxLength(self.MAX_DESCRIPTION_LENGTH)
         form.addRow("Description:", self.description_input)
 
         layout.addLayout(form)
@@ -8,9 +8,52 @@ from PyQt5.QtWidgets import (
     QMessageBox, QDialogButtonBox
 )
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPainter, QPixmap, QTextDocument
+from pathlib import Path
+from typing import Optional, Tuple
 
 from core.config import Config
 
+from ..about import ABOUT_HTML
+from ..styles import CHECKBOX_QSS
+
+
+# (full model id, settings short name) for each selectable default model
+_MODELS = (
+    ("claude-opus-4-5-20251101", "opus"),
+    ("claude-sonnet-4-20250514", "sonnet"),
+    ("claude-3-5-sonnet-20241022", "sonnet"),
+    ("claude-3-5-haiku-20241022", "haiku"),
+)
+
+
+# Width the About text is wrapped to, to fit the default dialog size
+_ABOUT_TEXT_WIDTH = 460
+# About text rendered once per session by _about_pixmap
+_about_pixmap_cache: Optional[QPixmap] = None
+
+
+def _about_pixmap(label: QLabel) -> QPixmap:
+    """Render the About HTML to a pixmap in the label's font, once per session."""
+    global _about_pixmap_cache
+    if _about_pixmap_cache is None:
+        doc = QTextDocument()
+        doc.setDefaultFont(label.font())
+        doc.setHtml(ABOUT_HTML)
+        doc.setTextWidth(_ABOUT_TEXT_WIDTH)
+
+        # Render at device resolution so the text stays sharp on HiDPI screens
+        ratio = label.devicePixelRatioF()
+        size = doc.size()
+        pixmap = QPixmap(int(size.width() * ratio), int(size.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        doc.drawContents(painter)
+        painter.end()
+        _about_pixmap_cache = pixmap
+    return _about_pixmap_cache
+
 
 class SettingsDialog(QDialog):
     """Settings configuration dialog."""
@@ -64,19 +107,17 @@ class SettingsDialog(QDialog):
         model_group = QGroupBox("Default Model")
         model_layout = QFormLayout(model_group)
 
+        # Each model carries the short name stored in settings.json
         self.model_combo = QComboBox()
-        self.model_combo.addItems([
-            "claude-opus-4-5-20251101",
-            "claude-sonnet-4-20250514",
-            "claude-3-5-sonnet-20241022",
-            "claude-3-5-haiku-20241022"
-        ])
+        for full_name, short_name in _MODELS:
+            self.model_combo.addItem(full_name, short_name)
         model_layout.addRow("Model:", self.model_combo)
 
         layout.addWidget(model_group)
 
         # UI settings
         ui_group = QGroupBox("User Interface")
+        ui_group.setStyleSheet(CHECKBOX_QSS)
         ui_layout = QFormLayout(ui_group)
 
         self.auto_refresh_check = QCheckBox()
@@ -100,29 +141,19 @@ class SettingsDialog(QDialog):
 
         # Claude paths
         paths_group = QGroupBox("Claude Code Paths")
-        paths_layout = QFormLayout(paths_group)
-
-        self.claude_dir_label = QLabel(str(self.config.claude_dir))
-        self.claude_dir_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        paths_layout.addRow("Claude Directory:", self.claude_dir_label)
-
-        self.projects_dir_label = QLabel(str(self.config.projects_dir))
-        self.projects_dir_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        paths_layout.addRow("Projects Directory:", self.projects_dir_label)
-
-        self.plugins_dir_label = QLabel(str(self.config.plugins_dir))
-        self.plugins_dir_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        paths_layout.addRow("Plugins Directory:", self.plugins_dir_label)
+        self._add_path_rows(QFormLayout(paths_group), (
+            ("Claude Directory:", self.config.claude_dir),
+            ("Projects Directory:", self.config.projects_dir),
+            ("Plugins Directory:", self.config.plugins_dir),
+        ))
 
         layout.addWidget(paths_group)
 
         # Desktop config
         desktop_group = QGroupBox("Claude Desktop")
-        desktop_layout = QFormLayout(desktop_group)
-
-        self.desktop_config_label = QLabel(str(self.config.claude_desktop_config))
-        self.desktop_config_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        desktop_layout.addRow("Config File:", self.desktop_config_label)
+        self._add_path_rows(QFormLayout(desktop_group), (
+            ("Config File:", self.config.claude_desktop_config),
+        ))
 
         layout.addWidget(desktop_group)
 
@@ -130,31 +161,22 @@ class SettingsDialog(QDialog):
 
         return tab
 
+    def _add_path_rows(self, form: QFormLayout, rows: Tuple[Tuple[str, Path], ...]) -> None:
+        """Add a selectable path label row to a form for each (name, path) pair."""
+        for name, path in rows:
+            label = QLabel(str(path))
+            label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            form.addRow(name, label)
+
     def create_about_tab(self) -> QWidget:
         """Create the about tab."""
         tab = QWidget()
         layout = QVBoxLayout(tab)
 
-        about_label = QLabel("""
-        <h2>Claude Code Manager</h2>
-        <p>Version 1.0.0</p>
-
-        <p>A comprehensive GUI application for managing Claude Code sessions,
-        custom agents, usage analytics, and more.</p>
-
-        <h3>Features:</h3>
-        <ul>
-            <li>Project & Session Management</li>
-            <li>Custom AI Agents</li>
-            <li>Usage Analytics Dashboard</li>
-            <li>MCP Server Management</li>
-            <li>Timeline & Checkpoints</li>
-            <li>CLAUDE.md File Management</li>
-        </ul>
-
-        <p>Built with PyQt5</p>
-        """)
-        about_label.setWordWrap(True)
+        # The text never changes, so show a pre-rendered image that resizing
+        # the dialog doesn't have to lay out again
+        about_label = QLabel()
+        about_label.setPixmap(_about_pixmap(about_label))
         layout.addWidget(about_label)
 
         layout.addStretch()
@@ -167,12 +189,10 @@ class SettingsDialog(QDialog):
 
         # Model
         model = settings.get('model', 'sonnet')
-        model_map = {
-            'opus': 'claude-opus-4-5-20251101',
-            'sonnet': 'claude-sonnet-4-20250514'
-        }
-        full_model = model_map.get(model, model)
-        index = self.model_combo.findText(full_model)
+        index = self.model_combo.findData(model)
+        if index < 0:
+            # A full model id rather than a short name
+            index = self.model_combo.findText(model)
         if index >= 0:
             self.model_combo.setCurrentIndex(index)
 
@@ -181,13 +201,7 @@ class SettingsDialog(QDialog):
         settings = self.config.settings.copy()
 
         # Get model short name
-        model_text = self.model_combo.currentText()
-        if 'opus' in model_text:
-            settings['model'] = 'opus'
-        elif 'sonnet' in model_text:
-            settings['model'] = 'sonnet'
-        elif 'haiku' in model_text:
-            settings['model'] = 'haiku'
+        settings['model'] = self.model_combo.currentData() or 'sonnet'
 
         if self.config.save_settings(settings):
             QMessageBox.information(self, "Success", "Settings saved")
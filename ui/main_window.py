@@ -7,39 +7,54 @@ from PyQt5.QtWidgets import (
     QStatusBar, QLabel, QAction, QMenuBar, QMenu, QMessageBox,
     QFileDialog, QToolBar, QPushButton, QSplitter, QFrame
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QEvent, QTimer, QThread, pyqtSignal
 from PyQt5.QtGui import QIcon, QKeySequence
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, List, Optional
 
 from core.config import Config
-from core.session_manager import SessionManager
-from core.agent_manager import AgentManager
-from core.analytics_manager import AnalyticsManager
-from core.mcp_manager import MCPManager
-from core.checkpoint_manager import CheckpointManager
-from core.claudemd_manager import ClaudeMdManager
 
-from .panels.projects_panel import ProjectsPanel
-from .panels.agents_panel import AgentsPanel
-from .panels.analytics_panel import AnalyticsPanel
-from .panels.mcp_panel import MCPPanel
-from .panels.timeline_panel import TimelinePanel
-from .panels.claudemd_panel import ClaudeMdPanel
+from .about import ABOUT_HTML
+
+
+@lru_cache(maxsize=None)
+def _key_sequence(shortcut: str) -> QKeySequence:
+    """Parse a shortcut string once and reuse the key sequence."""
+    return QKeySequence(shortcut)
+
+
+class StatsWorker(QThread):
+    """Worker thread for loading the status bar summary stats."""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, analytics_manager):
+        super().__init__()
+        self.analytics_manager = analytics_manager
+
+    def run(self):
+        """Load the summary stats."""
+        try:
+            self.finished.emit(self.analytics_manager.get_summary_stats())
+        except Exception as e:
+            self.error.emit(str(e))
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    TAB_NAMES = (
+        "Projects & Sessions", "Agents", "Analytics", "MCP Servers", "Timeline", "CLAUDE.md"
+    )
+    MCP_TAB = 3
+    CLAUDE_MD_TAB = 5
+    # Refresh requests within this window collapse into one refresh
+    REFRESH_DEBOUNCE_MS = 150
+
     def __init__(self, config: Config):
         super().__init__()
         self.config = config
-
-        # Initialize managers
-        self.session_manager = SessionManager(config)
-        self.agent_manager = AgentManager(config)
-        self.analytics_manager = AnalyticsManager(config)
-        self.mcp_manager = MCPManager(config)
-        self.checkpoint_manager = CheckpointManager(config)
-        self.claudemd_manager = ClaudeMdManager(config)
+        self._refresh_pending = False
 
         self.setup_ui()
         self.setup_menu()
@@ -50,6 +65,42 @@ class MainWindow(QMainWindow):
         self.refresh_timer.timeout.connect(self.auto_refresh)
         self.refresh_timer.start(60000)  # Refresh every minute
 
+    @cached_property
+    def session_manager(self):
+        """Session manager, imported and created on first use."""
+        from core.session_manager import SessionManager
+        return SessionManager(self.config)
+
+    @cached_property
+    def agent_manager(self):
+        """Agent manager, imported and created on first use."""
+        from core.agent_manager import AgentManager
+        return AgentManager(self.config)
+
+    @cached_property
+    def analytics_manager(self):
+        """Analytics manager, imported and created on first use."""
+        from core.analytics_manager import AnalyticsManager
+        return AnalyticsManager(self.config)
+
+    @cached_property
+    def mcp_manager(self):
+        """MCP manager, imported and created on first use."""
+        from core.mcp_manager import MCPManager
+        return MCPManager(self.config)
+
+    @cached_property
+    def checkpoint_manager(self):
+        """Checkpoint manager, imported and created on first use."""
+        from core.checkpoint_manager import CheckpointManager
+        return CheckpointManager(self.config)
+
+    @cached_property
+    def claudemd_manager(self):
+        """CLAUDE.md manager, imported and created on first use."""
+        from core.claudemd_manager import ClaudeMdManager
+        return ClaudeMdManager(self.config)
+
     def setup_ui(self):
         """Setup the user interface."""
         self.setWindowTitle("Claude Code Manager")
@@ -59,6 +110,8 @@ class MainWindow(QMainWindow):
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
+        # Hold repaints (for the tabs too) until the header and tabs are all in place
+        central_widget.setUpdatesEnabled(False)
 
         # Main layout
         layout = QVBoxLayout(central_widget)
@@ -73,51 +126,89 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget()
         self.tab_widget.setDocumentMode(True)
 
-        # Create panels
-        self.projects_panel = ProjectsPanel(
-            self.session_manager,
-            self.checkpoint_manager
-        )
-        self.agents_panel = AgentsPanel(self.agent_manager)
-        self.analytics_panel = AnalyticsPanel(self.analytics_manager)
-        self.mcp_panel = MCPPanel(self.mcp_manager, self.config)
-        self.timeline_panel = TimelinePanel(
-            self.checkpoint_manager,
-            self.session_manager
-        )
-        self.claudemd_panel = ClaudeMdPanel(self.claudemd_manager)
+        # Panels are built the first time their tab is shown; until then each
+        # tab holds an empty placeholder
+        self._panel_factories: List[Callable[[], QWidget]] = [
+            self._create_projects_panel,
+            self._create_agents_panel,
+            self._create_analytics_panel,
+            self._create_mcp_panel,
+            self._create_timeline_panel,
+            self._create_claudemd_panel,
+        ]
+        self._panels: Dict[int, QWidget] = {}
 
         # Add tabs
-        self.tab_widget.addTab(self.projects_panel, "Projects & Sessions")
-        self.tab_widget.addTab(self.agents_panel, "Agents")
-        self.tab_widget.addTab(self.analytics_panel, "Analytics")
-        self.tab_widget.addTab(self.mcp_panel, "MCP Servers")
-        self.tab_widget.addTab(self.timeline_panel, "Timeline")
-        self.tab_widget.addTab(self.claudemd_panel, "CLAUDE.md")
+        for name in self.TAB_NAMES:
+            self.tab_widget.addTab(QWidget(), name)
+        self.tab_widget.currentChanged.connect(self.get_panel)
+        self.get_panel(self.tab_widget.currentIndex())
 
         layout.addWidget(self.tab_widget)
+        central_widget.setUpdatesEnabled(True)
+
+    def get_panel(self, index: int) -> QWidget:
+        """Get the panel for a tab, building it on first use."""
+        panel = self._panels.get(index)
+        if panel is None:
+            panel = self._panel_factories[index]()
+            self._panels[index] = panel
+
+            # Swap the placeholder out without re-entering via currentChanged
+            current = self.tab_widget.currentIndex()
+            placeholder = self.tab_widget.widget(index)
+            self.tab_widget.setUpdatesEnabled(False)
+            self.tab_widget.blockSignals(True)
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, panel, self.TAB_NAMES[index])
+            self.tab_widget.setCurrentIndex(current)
+            self.tab_widget.blockSignals(False)
+            self.tab_widget.setUpdatesEnabled(True)
+            placeholder.deleteLater()
+        return panel
+
+    def _create_projects_panel(self) -> QWidget:
+        """Import and create the Projects panel."""
+        from .panels.projects_panel import ProjectsPanel
+        return ProjectsPanel(self.session_manager, self.checkpoint_manager)
+
+    def _create_agents_panel(self) -> QWidget:
+        """Import and create the Agents panel."""
+        from .panels.agents_panel import AgentsPanel
+        return AgentsPanel(self.agent_manager)
+
+    def _create_analytics_panel(self) -> QWidget:
+        """Import and create the Analytics panel."""
+        from .panels.analytics_panel import AnalyticsPanel
+        return AnalyticsPanel(self.analytics_manager)
+
+    def _create_mcp_panel(self) -> QWidget:
+        """Import and create the MCP panel."""
+        from .panels.mcp_panel import MCPPanel
+        return MCPPanel(self.mcp_manager, self.config)
+
+    def _create_timeline_panel(self) -> QWidget:
+        """Import and create the Timeline panel."""
+        from .panels.timeline_panel import TimelinePanel
+        return TimelinePanel(self.checkpoint_manager, self.session_manager)
+
+    def _create_claudemd_panel(self) -> QWidget:
+        """Import and create the CLAUDE.md panel."""
+        from .panels.claudemd_panel import ClaudeMdPanel
+        return ClaudeMdPanel(self.claudemd_manager)
 
     def create_header(self) -> QWidget:
         """Create the header widget."""
+        # Styled by the #header and #headerTitle rules in the app stylesheet
         header = QFrame()
         header.setObjectName("header")
-        header.setStyleSheet("""
-            #header {
-                background-color: #252526;
-                border-bottom: 1px solid #3d3d3d;
-            }
-        """)
 
         layout = QHBoxLayout(header)
         layout.setContentsMargins(16, 8, 16, 8)
 
         # Logo/Title
         title = QLabel("Claude Code Manager")
-        title.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #6495ed;
-        """)
+        title.setObjectName("headerTitle")
         layout.addWidget(title)
 
         layout.addStretch()
@@ -143,14 +234,14 @@ class MainWindow(QMainWindow):
         file_menu = menubar.addMenu("File")
 
         export_action = QAction("Export Analytics...", self)
-        export_action.setShortcut(QKeySequence("Ctrl+E"))
+        export_action.setShortcut(_key_sequence("Ctrl+E"))
         export_action.triggered.connect(self.export_analytics)
         file_menu.addAction(export_action)
 
         file_menu.addSeparator()
 
         exit_action = QAction("Exit", self)
-        exit_action.setShortcut(QKeySequence("Ctrl+Q"))
+        exit_action.setShortcut(_key_sequence("Ctrl+Q"))
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
@@ -158,23 +249,24 @@ class MainWindow(QMainWindow):
         view_menu = menubar.addMenu("View")
 
         refresh_action = QAction("Refresh All", self)
-        refresh_action.setShortcut(QKeySequence("F5"))
+        refresh_action.setShortcut(_key_sequence("F5"))
         refresh_action.triggered.connect(self.refresh_all)
         view_menu.addAction(refresh_action)
 
         view_menu.addSeparator()
 
-        for i, (name, panel) in enumerate([
-            ("Projects", self.projects_panel),
-            ("Agents", self.agents_panel),
-            ("Analytics", self.analytics_panel),
-            ("MCP Servers", self.mcp_panel),
-            ("Timeline", self.timeline_panel),
-            ("CLAUDE.md", self.claudemd_panel),
+        for i, name in enumerate([
+            "Projects",
+            "Agents",
+            "Analytics",
+            "MCP Servers",
+            "Timeline",
+            "CLAUDE.md",
         ]):
             action = QAction(name, self)
-            action.setShortcut(QKeySequence(f"Ctrl+{i + 1}"))
-            action.triggered.connect(lambda checked, idx=i: self.tab_widget.setCurrentIndex(idx))
+            action.setShortcut(_key_sequence(f"Ctrl+{i + 1}"))
+            action.setData(i)
+            action.triggered.connect(self._show_tab_for_action)
             view_menu.addAction(action)
 
         # Tools menu
@@ -195,6 +287,10 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
 
+    def _show_tab_for_action(self):
+        """Switch to the tab stored in the triggering View menu action."""
+        self.tab_widget.setCurrentIndex(self.sender().data())
+
     def setup_statusbar(self):
         """Setup the status bar."""
         self.statusbar = QStatusBar()
@@ -203,13 +299,23 @@ class MainWindow(QMainWindow):
         # Stats label
         self.stats_label = QLabel()
         self.statusbar.addPermanentWidget(self.stats_label)
+        self._stats_worker: Optional[StatsWorker] = None
 
         self.update_stats_label()
 
     def update_stats_label(self):
         """Update the stats label in status bar."""
+        # Stats load off the GUI thread; a load still in flight covers this request
+        if self._stats_worker is not None and self._stats_worker.isRunning():
+            return
+        self._stats_worker = StatsWorker(self.analytics_manager)
+        self._stats_worker.finished.connect(self.on_stats_loaded)
+        self._stats_worker.error.connect(lambda _: self.stats_label.setText("Stats unavailable"))
+        self._stats_worker.start()
+
+    def on_stats_loaded(self, summary: Dict[str, Any]):
+        """Show loaded summary stats in the status bar."""
         try:
-            summary = self.analytics_manager.get_summary_stats()
             self.stats_label.setText(
                 f"Sessions: {summary['total_sessions']} | "
                 f"Messages: {summary['total_messages']} | "
@@ -219,16 +325,21 @@ class MainWindow(QMainWindow):
             self.stats_label.setText("Stats unavailable")
 
     def refresh_all(self):
-        """Refresh all panels."""
+        """Refresh all panels, once per burst of requests."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
         self.statusbar.showMessage("Refreshing...", 2000)
+        QTimer.singleShot(self.REFRESH_DEBOUNCE_MS, self._do_refresh_all)
+
+    def _do_refresh_all(self):
+        """Refresh all panels."""
+        self._refresh_pending = False
 
         self.session_manager.clear_cache()
-        self.projects_panel.refresh()
-        self.agents_panel.refresh()
-        self.analytics_panel.refresh()
-        self.mcp_panel.refresh()
-        self.timeline_panel.refresh()
-        self.claudemd_panel.refresh()
+        # Panels not built yet load fresh data when first shown
+        for panel in self._panels.values():
+            panel.refresh()
 
         self.update_stats_label()
         self.statusbar.showMessage("Refreshed", 2000)
@@ -257,7 +368,8 @@ class MainWindow(QMainWindow):
         """Import MCP servers from Claude Desktop."""
         imported = self.mcp_manager.import_from_claude_desktop()
         if imported:
-            self.mcp_panel.refresh()
+            if self.MCP_TAB in self._panels:
+                self._panels[self.MCP_TAB].refresh()
             QMessageBox.information(
                 self,
                 "Import Complete",
@@ -272,8 +384,10 @@ class MainWindow(QMainWindow):
 
     def scan_claude_md(self):
         """Scan for CLAUDE.md files."""
-        self.claudemd_panel.refresh()
-        self.tab_widget.setCurrentWidget(self.claudemd_panel)
+        if self.CLAUDE_MD_TAB in self._panels:
+            self._panels[self.CLAUDE_MD_TAB].refresh()
+        # A panel built by switching to it scans on construction
+        self.tab_widget.setCurrentIndex(self.CLAUDE_MD_TAB)
         self.statusbar.showMessage("Scanning for CLAUDE.md files...", 3000)
 
     def show_settings(self):
@@ -284,25 +398,40 @@ class MainWindow(QMainWindow):
 
     def show_about(self):
         """Show about dialog."""
-        QMessageBox.about(
-            self,
-            "About Claude Code Manager",
-            """<h2>Claude Code Manager</h2>
-            <p>Version 1.0.0</p>
-            <p>A comprehensive GUI for managing Claude Code sessions, agents, and analytics.</p>
-            <p>Features:</p>
-            <ul>
-                <li>Project & Session Management</li>
-                <li>Custom AI Agents</li>
-                <li>Usage Analytics Dashboard</li>
-                <li>MCP Server Management</li>
-                <li>Timeline & Checkpoints</li>
-                <li>CLAUDE.md Management</li>
-            </ul>
-            """
-        )
+        QMessageBox.about(self, "About Claude Code Manager", ABOUT_HTML)
+
+    def showEvent(self, event):
+        """Resume the stats refresh timer when the window is shown."""
+        super().showEvent(event)
+        self._update_refresh_timer()
+
+    def hideEvent(self, event):
+        """Pause the stats refresh timer while the window is hidden."""
+        super().hideEvent(event)
+        self._update_refresh_timer()
+
+    def changeEvent(self, event):
+        """Pause or resume the stats refresh timer on minimize and restore."""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._update_refresh_timer()
+
+    def _update_refresh_timer(self):
+        """Run the refresh timer only while the window can be seen."""
+        visible = self.isVisible() and not self.isMinimized()
+        if not visible:
+            self.refresh_timer.stop()
+        elif not self.refresh_timer.isActive():
+            # Catch up on anything missed while the timer was paused
+            self.refresh_timer.start(60000)
+            self.update_stats_label()
 
     def closeEvent(self, event):
         """Handle close event."""
         self.refresh_timer.stop()
+        if self._stats_worker is not None:
+            self._stats_worker.wait()
+        # Only an agent manager that was ever created has runs to wind down
+        if 'agent_manager' in self.__dict__:
+            self.agent_manager.shutdown()
         event.accept()
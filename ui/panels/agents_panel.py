@@ -5,53 +5,140 @@ Agents panel for Claude Code Manager.
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter, QListWidget, QListWidgetItem,
     QTextEdit, QLabel, QLineEdit, QPushButton, QGroupBox, QComboBox,
-    QDoubleSpinBox, QPlainTextEdit, QTableWidget, QTableWidgetItem,
+    QDoubleSpinBox, QPlainTextEdit, QTableView,
     QHeaderView, QMessageBox, QMenu, QAction, QDialog, QFormLayout,
     QDialogButtonBox
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import (
+    Qt, QObject, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex
+)
+from PyQt5.QtGui import QColor, QFont
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.agent_manager import AgentManager
 from core.models import Agent, AgentRun
 
+from ..styles import SPINBOX_QSS
+
 
-class AgentWorker(QThread):
-    """Worker thread for running agents."""
+class AgentSignals(QObject):
+    """Carries agent run results from the manager's worker threads to the UI thread."""
     finished = pyqtSignal(object)
-    error = pyqtSignal(str)
 
-    def __init__(self, agent_manager: AgentManager, agent: Agent, prompt: str):
-        super().__init__()
-        self.agent_manager = agent_manager
-        self.agent = agent
-        self.prompt = prompt
 
-    def run(self):
-        """Run the agent."""
-        try:
-            run = self.agent_manager.run_agent(
-                self.agent,
-                self.prompt,
-                background=False
-            )
-            self.finished.emit(run)
-        except Exception as e:
-            self.error.emit(str(e))
+class RunsModel(QAbstractTableModel):
+    """Table model for the agent execution history."""
+
+    HEADERS = ("Agent", "Status", "Started", "Duration")
+    STATUS_COLORS = {"completed": QColor(Qt.green), "failed": QColor(Qt.red)}
+
+    def __init__(self):
+        super().__init__()
+        self._runs: List[AgentRun] = []
+        self._rows: List[Tuple[str, str, str, str]] = []
+        self._signature: Optional[list] = None
+        # Formatted row by run id, with the (id, status, completed) it was formatted at
+        self._row_cache: Dict[str, Tuple[tuple, Tuple[str, str, str, str]]] = {}
+
+    def set_runs(self, runs: List[AgentRun]) -> None:
+        """Replace the runs shown, formatting each row's cells once."""
+        # Keep a snapshot; the manager inserts and swaps runs in its own list
+        runs = list(runs)
+        # Nothing on screen changes unless a run was added, removed or finished
+        signature = [(run.run_id, run.status, run.completed) for run in runs]
+        if signature == self._signature:
+            self._runs = runs
+            return
+        self._signature = signature
+
+        # Finished runs never change, so only new or just-finished runs are formatted
+        row_cache = {}
+        rows = []
+        for run, key in zip(runs, signature):
+            cached = self._row_cache.get(run.run_id)
+            if cached is not None and cached[0] == key:
+                row = cached[1]
+            else:
+                if run.completed:
+                    duration = f"{(run.completed - run.started).total_seconds():.1f}s"
+                else:
+                    duration = "-"
+                row = (
+                    run.agent_name,
+                    run.status,
+                    run.started.strftime("%Y-%m-%d %H:%M"),
+                    duration
+                )
+            row_cache[run.run_id] = (key, row)
+            rows.append(row)
+        self._row_cache = row_cache
+
+        self.beginResetModel()
+        self._runs = runs
+        self._rows = rows
+        self.endResetModel()
+
+    def run_at(self, row: int) -> Optional[AgentRun]:
+        """Get the run shown in a row."""
+        if 0 <= row < len(self._runs):
+            return self._runs[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of runs shown."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Number of history columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell text, and the status column's color."""
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ForegroundRole and index.column() == 1:
+            return self.STATUS_COLORS.get(self._runs[index.row()].status)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column titles."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
 
 
 class AgentsPanel(QWidget):
     """Panel for managing custom agents."""
 
+    # Characters of a run's prompt or response shown before "Load full" is needed
+    INLINE_TEXT_LIMIT = 64 * 1024
+    EXPORT_COMPACT_FILTER = "JSON Files (*.json)"
+    EXPORT_PRETTY_FILTER = "Pretty-printed JSON (*.json)"
+
     def __init__(self, agent_manager: AgentManager):
         super().__init__()
         self.agent_manager = agent_manager
         self.current_agent = None
-        self.worker = None
+        # Runs finish on the manager's workers; the signal delivers them here
+        self.run_signals = AgentSignals()
+        self.run_signals.finished.connect(self.on_agent_finished)
+        # Run details dialog, its (text view, load button) pairs and full texts by title
+        self._run_details_dialog: Optional[QDialog] = None
+        self._run_text_views: Dict[str, Tuple[QPlainTextEdit, QPushButton]] = {}
+        self._run_texts: Dict[str, str] = {}
+        # Set when runs may have changed on disk since the history was loaded
+        self._runs_dirty = True
+        # Run stats by agent name; they only change when a run finishes
+        self._stats_cache: Dict[str, Dict[str, Any]] = {}
+        # Set while a coalesced refresh is queued for the next event loop turn
+        self._refresh_pending = False
+        self._refresh_history_pending = False
 
         self.setup_ui()
-        self.refresh()
+        self._do_refresh()
 
     def setup_ui(self):
         """Setup the user interface."""
@@ -141,9 +228,14 @@ class AgentsPanel(QWidget):
             "claude-3-5-sonnet-20241022",
             "claude-3-5-haiku-20241022"
         ])
+        # Combo index by model id, so selecting an agent needn't scan the items
+        self._model_index = {
+            self.model_combo.itemText(i): i for i in range(self.model_combo.count())
+        }
         details_layout.addRow("Model:", self.model_combo)
 
         self.temp_spinbox = QDoubleSpinBox()
+        self.temp_spinbox.setStyleSheet(SPINBOX_QSS)
         self.temp_spinbox.setRange(0.0, 2.0)
         self.temp_spinbox.setSingleStep(0.1)
         self.temp_spinbox.setValue(1.0)
@@ -218,12 +310,12 @@ class AgentsPanel(QWidget):
         layout.addWidget(header)
 
         # History table
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(4)
-        self.history_table.setHorizontalHeaderLabels(["Agent", "Status", "Started", "Duration"])
+        self.history_model = RunsModel()
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.history_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.history_table.itemDoubleClicked.connect(self.show_run_details)
+        self.history_table.setSelectionBehavior(QTableView.SelectRows)
+        self.history_table.doubleClicked.connect(self.show_run_details)
         layout.addWidget(self.history_table)
 
         # Stats
@@ -233,75 +325,101 @@ class AgentsPanel(QWidget):
         return panel
 
     def refresh(self):
-        """Refresh the agent list."""
-        self.agent_list.clear()
-
-        # Load agents
-        agents = self.agent_manager.get_agents(force_refresh=True)
-        for agent in agents:
-            item = QListWidgetItem(agent.name)
-            item.setData(Qt.UserRole, agent)
-            item.setToolTip(agent.description)
-            self.agent_list.addItem(item)
-
-        # Load templates
-        self.template_combo.clear()
-        templates = self.agent_manager.get_default_agents()
-        for template in templates:
-            self.template_combo.addItem(template.name, template)
+        """Refresh the panel, once per burst of requests."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        """Refresh the agent list, templates and history."""
+        self._refresh_pending = False
+        self.refresh_agents(force_refresh=True)
+
+        # Load templates (the built-in set never changes)
+        if self.template_combo.count() == 0:
+            templates = self.agent_manager.get_default_agents()
+            for template in templates:
+                self.template_combo.addItem(template.name, template)
 
         # Load history
-        self.refresh_history()
+        self._runs_dirty = True
+        self._stats_cache.clear()
+        self._do_refresh_history()
+
+    def refresh_agents(self, force_refresh: bool = False):
+        """Bring the agent list in line with the saved agents, touching only changed rows."""
+        agents = self.agent_manager.get_agents(force_refresh=force_refresh)
+        wanted = {agent.name: agent for agent in agents}
+
+        # Drop rows for agents that no longer exist
+        for row in reversed(range(self.agent_list.count())):
+            if self.agent_list.item(row).text() not in wanted:
+                self.agent_list.takeItem(row)
+
+        existing = {}
+        for row in range(self.agent_list.count()):
+            item = self.agent_list.item(row)
+            existing[item.text()] = item
+
+        for row, agent in enumerate(agents):
+            item = existing.get(agent.name)
+            if item is None:
+                item = QListWidgetItem(agent.name)
+                self.agent_list.insertItem(row, item)
+            if item.data(Qt.UserRole) is not agent:
+                item.setData(Qt.UserRole, agent)
+            if item.toolTip() != agent.description:
+                item.setToolTip(agent.description)
 
     def refresh_history(self):
-        """Refresh execution history."""
-        runs = self.agent_manager.get_runs(force_refresh=True)
+        """Refresh execution history, once per burst of requests."""
+        if self._refresh_history_pending:
+            return
+        self._refresh_history_pending = True
+        QTimer.singleShot(0, self._do_refresh_history)
 
-        self.history_table.setRowCount(len(runs))
+    def _do_refresh_history(self):
+        """Refresh execution history."""
+        self._refresh_history_pending = False
+        runs = self.agent_manager.get_runs(force_refresh=self._runs_dirty)
+        self._runs_dirty = False
+        self.history_model.set_runs(runs)
 
-        for i, run in enumerate(runs):
-            self.history_table.setItem(i, 0, QTableWidgetItem(run.agent_name))
+    def on_agent_selected(self, item: QListWidgetItem):
+        """Handle agent selection."""
+        agent = item.data(Qt.UserRole)
+        # Clicking the agent already being edited has nothing to load
+        if agent is None or agent is self.current_agent:
+            return
+        self.current_agent = agent
+        self.name_input.setText(agent.name)
+        self.description_input.setText(agent.description)
+        self.system_prompt_edit.setPlainText(agent.system_prompt)
 
-            status_item = QTableWidgetItem(run.status)
-            if run.status == "completed":
-                status_item.setForeground(Qt.green)
-            elif run.status == "failed":
-                status_item.setForeground(Qt.red)
-            self.history_table.setItem(i, 1, status_item)
+        # Set model
+        self._select_model(agent.model)
 
-            self.history_table.setItem(i, 2, QTableWidgetItem(
-                run.started.strftime("%Y-%m-%d %H:%M")
-            ))
+        self.temp_spinbox.setValue(agent.temperature)
 
-            if run.completed:
-                duration = (run.completed - run.started).total_seconds()
-                self.history_table.setItem(i, 3, QTableWidgetItem(f"{duration:.1f}s"))
-            else:
-                self.history_table.setItem(i, 3, QTableWidgetItem("-"))
+        self._update_stats_label(agent)
+
+    def _update_stats_label(self, agent: Agent) -> None:
+        """Show an agent's run stats, loading them if they aren't cached."""
+        stats = self._stats_cache.get(agent.name)
+        if stats is None:
+            stats = self._stats_cache[agent.name] = self.agent_manager.get_agent_stats(agent.name)
+        self.stats_label.setText(
+            f"Runs: {stats['total_runs']} | "
+            f"Success: {stats['successful_runs']} | "
+            f"Failed: {stats['failed_runs']}"
+        )
 
-    def on_agent_selected(self, item: QListWidgetItem):
-        """Handle agent selection."""
-        agent = item.data(Qt.UserRole)
-        if agent:
-            self.current_agent = agent
-            self.name_input.setText(agent.name)
-            self.description_input.setText(agent.description)
-            self.system_prompt_edit.setPlainText(agent.system_prompt)
-
-            # Set model
-            index = self.model_combo.findText(agent.model)
-            if index >= 0:
-                self.model_combo.setCurrentIndex(index)
-
-            self.temp_spinbox.setValue(agent.temperature)
-
-            # Update stats
-            stats = self.agent_manager.get_agent_stats(agent.name)
-            self.stats_label.setText(
-                f"Runs: {stats['total_runs']} | "
-                f"Success: {stats['successful_runs']} | "
-                f"Failed: {stats['failed_runs']}"
-            )
+    def _select_model(self, model: str) -> None:
+        """Select a model in the combo, leaving it unchanged for unknown models."""
+        index = self._model_index.get(model)
+        if index is not None:
+            self.model_combo.setCurrentIndex(index)
 
     def create_new_agent(self):
         """Create a new agent."""
@@ -322,9 +440,7 @@ class AgentsPanel(QWidget):
             self.description_input.setText(template.description)
             self.system_prompt_edit.setPlainText(template.system_prompt)
 
-            index = self.model_combo.findText(template.model)
-            if index >= 0:
-                self.model_combo.setCurrentIndex(index)
+            self._select_model(template.model)
 
             self.temp_spinbox.setValue(template.temperature)
 
@@ -350,15 +466,18 @@ class AgentsPanel(QWidget):
             agent.last_used = self.current_agent.last_used
 
             if self.agent_manager.update_agent(name, agent):
+                # The manager now holds this instance; edit and run it from here on
+                self.current_agent = agent
                 QMessageBox.information(self, "Success", "Agent updated successfully")
-                self.refresh()
+                self.refresh_agents()
             else:
                 QMessageBox.warning(self, "Error", "Failed to update agent")
         else:
             # Create new
             if self.agent_manager.create_agent(agent):
+                self.current_agent = agent
                 QMessageBox.information(self, "Success", "Agent created successfully")
-                self.refresh()
+                self.refresh_agents()
             else:
                 QMessageBox.warning(self, "Error", "Agent with this name already exists")
 
@@ -377,7 +496,7 @@ class AgentsPanel(QWidget):
         if reply == QMessageBox.Yes:
             if self.agent_manager.delete_agent(self.current_agent.name):
                 self.create_new_agent()
-                self.refresh()
+                self.refresh_agents()
             else:
                 QMessageBox.warning(self, "Error", "Failed to delete agent")
 
@@ -396,21 +515,23 @@ class AgentsPanel(QWidget):
         self.run_bg_btn.setEnabled(False)
         self.response_edit.setText("Running agent...")
 
-        if background:
+        # Both modes run on the manager's worker pool; a foreground run only
+        # keeps the buttons disabled until it finishes
+        try:
             self.agent_manager.run_agent(
                 self.current_agent,
                 prompt,
-                callback=self.on_agent_finished,
+                callback=self.run_signals.finished.emit,
                 background=True
             )
+        except Exception as e:
+            self.on_agent_error(str(e))
+            return
+
+        if background:
             self.response_edit.setText("Agent running in background...")
             self.run_btn.setEnabled(True)
             self.run_bg_btn.setEnabled(True)
-        else:
-            self.worker = AgentWorker(self.agent_manager, self.current_agent, prompt)
-            self.worker.finished.connect(self.on_agent_finished)
-            self.worker.error.connect(self.on_agent_error)
-            self.worker.start()
 
     def on_agent_finished(self, run: AgentRun):
         """Handle agent completion."""
@@ -418,10 +539,15 @@ class AgentsPanel(QWidget):
         self.run_bg_btn.setEnabled(True)
 
         if run.status == "completed":
-            self.response_edit.setText(run.response)
+            self.response_edit.setText(self.agent_manager.get_run_response(run))
         else:
             self.response_edit.setText(f"Error: {run.error or 'Unknown error'}")
 
+        self._runs_dirty = True
+        self._stats_cache.pop(run.agent_name, None)
+        # Re-selecting the agent is a no-op now, so show its new stats here
+        if self.current_agent is not None and self.current_agent.name == run.agent_name:
+            self._update_stats_label(self.current_agent)
         self.refresh_history()
 
     def on_agent_error(self, error: str):
@@ -429,6 +555,11 @@ class AgentsPanel(QWidget):
         self.run_btn.setEnabled(True)
         self.run_bg_btn.setEnabled(True)
         self.response_edit.setText(f"Error: {error}")
+        self._runs_dirty = True
+        # The failed run's agent isn't known here, so drop every agent's stats
+        self._stats_cache.clear()
+        if self.current_agent is not None:
+            self._update_stats_label(self.current_agent)
 
     def show_agent_context_menu(self, position):
         """Show context menu for agent list."""
@@ -455,64 +586,93 @@ class AgentsPanel(QWidget):
         self.description_input.setText(agent.description)
         self.system_prompt_edit.setPlainText(agent.system_prompt)
 
-        index = self.model_combo.findText(agent.model)
-        if index >= 0:
-            self.model_combo.setCurrentIndex(index)
+        self._select_model(agent.model)
 
         self.temp_spinbox.setValue(agent.temperature)
 
     def export_agent(self, agent: Agent):
         """Export agent to file."""
         from PyQt5.QtWidgets import QFileDialog
-        import json
 
-        filepath, _ = QFileDialog.getSaveFileName(
+        # Exports are compact unless the pretty-printed filter is picked
+        filepath, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Export Agent",
             f"{agent.name}.json",
-            "JSON Files (*.json)"
+            f"{self.EXPORT_COMPACT_FILTER};;{self.EXPORT_PRETTY_FILTER}"
         )
 
         if filepath:
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(agent.to_dict(), f, indent=2)
+                agent.write_json(f, indent=selected_filter == self.EXPORT_PRETTY_FILTER)
             QMessageBox.information(self, "Success", f"Agent exported to {filepath}")
 
-    def show_run_details(self, item: QTableWidgetItem):
+    def show_run_details(self, index: QModelIndex):
         """Show details of a run."""
-        row = item.row()
-        runs = self.agent_manager.get_runs()
-
-        if 0 <= row < len(runs):
-            run = runs[row]
-            dialog = QDialog(self)
+        # The history model holds the runs as last loaded, in row order
+        run = self.history_model.run_at(index.row())
+        if run is not None:
+            # One dialog is built on first use and refilled for each run
+            if self._run_details_dialog is None:
+                self._run_details_dialog = self._create_run_details_dialog()
+            dialog = self._run_details_dialog
             dialog.setWindowTitle(f"Run Details - {run.agent_name}")
-            dialog.resize(600, 400)
-
-            layout = QVBoxLayout(dialog)
 
-            info = QLabel(
+            self._run_info_label.setText(
                 f"Agent: {run.agent_name}\n"
                 f"Status: {run.status}\n"
                 f"Started: {run.started}\n"
                 f"Completed: {run.completed or 'N/A'}"
             )
-            layout.addWidget(info)
-
-            prompt_group = QGroupBox("Prompt")
-            prompt_layout = QVBoxLayout(prompt_group)
-            prompt_text = QTextEdit()
-            prompt_text.setReadOnly(True)
-            prompt_text.setText(run.prompt)
-            prompt_layout.addWidget(prompt_text)
-            layout.addWidget(prompt_group)
-
-            response_group = QGroupBox("Response")
-            response_layout = QVBoxLayout(response_group)
-            response_text = QTextEdit()
-            response_text.setReadOnly(True)
-            response_text.setText(run.response or run.error or "No response")
-            response_layout.addWidget(response_text)
-            layout.addWidget(response_group)
-
-            dialog.exec_()
+            self._set_run_text("Prompt", run.prompt)
+            self._set_run_text(
+                "Response", self.agent_manager.get_run_response(run) or run.error or "No response"
+            )
+
+            dialog.show()
+            dialog.raise_()
+            dialog.activateWindow()
+
+    def _create_run_details_dialog(self) -> QDialog:
+        """Create the run details dialog with empty info and text views."""
+        dialog = QDialog(self)
+        dialog.resize(600, 400)
+
+        layout = QVBoxLayout(dialog)
+
+        self._run_info_label = QLabel()
+        layout.addWidget(self._run_info_label)
+
+        for title in ("Prompt", "Response"):
+            group = QGroupBox(title)
+            group_layout = QVBoxLayout(group)
+            # Plain text skips rich-text detection and layout of long outputs
+            text_edit = QPlainTextEdit()
+            text_edit.setReadOnly(True)
+            text_edit.setUndoRedoEnabled(False)
+            group_layout.addWidget(text_edit)
+
+            load_btn = QPushButton(f"Load full {title.lower()}")
+            load_btn.setProperty("secondary", True)
+            load_btn.clicked.connect(lambda _=False, t=title: self._load_full_run_text(t))
+            group_layout.addWidget(load_btn)
+
+            self._run_text_views[title] = (text_edit, load_btn)
+            layout.addWidget(group)
+
+        return dialog
+
+    def _set_run_text(self, title: str, text: str) -> None:
+        """Show a run's text up to the inline limit, offering the rest on demand."""
+        text_edit, load_btn = self._run_text_views[title]
+        self._run_texts[title] = text
+        text_edit.setPlainText(text[:self.INLINE_TEXT_LIMIT])
+        load_btn.setVisible(len(text) > self.INLINE_TEXT_LIMIT)
+
+    def _load_full_run_text(self, title: str) -> None:
+        """Append the part of a run's text past the inline limit."""
+        text_edit, load_btn = self._run_text_views[title]
+        cursor = text_edit.textCursor()
+        cursor.movePosition(cursor.End)
+        cursor.insertText(self._run_texts[title][self.INLINE_TEXT_LIMIT:])
+        load_btn.hide()
@@ -11,8 +11,10 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QPainter, QColor, QPen
 from PyQt5.QtChart import QChart, QChartView, QLineSeries, QBarSeries, QBarSet, QValueAxis, QBarCategoryAxis, QPieSeries
 from datetime import datetime, timedelta
+from typing import Any, Dict, List
 
 from core.analytics_manager import AnalyticsManager
+from core.models import DailyActivity, ModelUsage
 
 
 class StatCard(QFrame):
@@ -55,6 +57,8 @@ class AnalyticsPanel(QWidget):
     def __init__(self, analytics_manager: AnalyticsManager):
         super().__init__()
         self.analytics_manager = analytics_manager
+        # (days, date, data version) last shown; refreshing with the same key is a no-op
+        self._shown_key = None
 
         self.setup_ui()
         self.refresh()
@@ -189,8 +193,19 @@ class AnalyticsPanel(QWidget):
         range_map = {0: 7, 1: 30, 2: 90, 3: 365}
         days = range_map.get(self.time_range_combo.currentIndex(), 30)
 
-        # Update stats cards
+        # Pick up a changed stats file; an unchanged one keeps its data version
+        self.analytics_manager.get_stats_cache(force_refresh=True)
+        # The date is part of the key because the day ranges roll over at midnight
+        key = (days, datetime.now().date(), self.analytics_manager.data_version)
+        if key == self._shown_key:
+            return
+        self._shown_key = key
+
+        # Fetch each dataset once and hand it to the views that show it
         summary = self.analytics_manager.get_summary_stats()
+        usage = self.analytics_manager.get_model_usage()
+
+        # Update stats cards
         self.sessions_card.set_value(str(summary['total_sessions']))
         self.messages_card.set_value(str(summary['total_messages']))
 
@@ -204,18 +219,16 @@ class AnalyticsPanel(QWidget):
         self.cost_card.set_value(f"${summary['total_cost']:.2f}")
 
         # Update charts
-        self.update_activity_chart(days)
-        self.update_tokens_chart(days)
-        self.update_model_chart()
+        self.update_activity_chart(self.analytics_manager.get_daily_activity(days))
+        self.update_tokens_chart(self.analytics_manager.get_tokens_by_day(days))
+        self.update_model_chart(usage)
         self.update_hour_chart(summary.get('hour_distribution', {}))
 
         # Update details table
-        self.update_details_table()
+        self.update_details_table(usage)
 
-    def update_activity_chart(self, days: int):
+    def update_activity_chart(self, activity: List[DailyActivity]):
         """Update the activity chart."""
-        activity = self.analytics_manager.get_daily_activity(days)
-
         chart = QChart()
         chart.setBackgroundBrush(QColor("#252526"))
         chart.setTitleBrush(QColor("#dcdcdc"))
@@ -247,10 +260,8 @@ class AnalyticsPanel(QWidget):
 
         self.activity_chart.setChart(chart)
 
-    def update_tokens_chart(self, days: int):
+    def update_tokens_chart(self, tokens_data: List[Dict[str, Any]]):
         """Update the tokens chart."""
-        tokens_data = self.analytics_manager.get_tokens_by_day(days)
-
         chart = QChart()
         chart.setBackgroundBrush(QColor("#252526"))
         chart.legend().setLabelColor(QColor("#dcdcdc"))
@@ -282,10 +293,8 @@ class AnalyticsPanel(QWidget):
 
         self.tokens_chart.setChart(chart)
 
-    def update_model_chart(self):
+    def update_model_chart(self, usage: Dict[str, ModelUsage]):
         """Update the model usage pie chart."""
-        usage = self.analytics_manager.get_model_usage()
-
         chart = QChart()
         chart.setBackgroundBrush(QColor("#252526"))
         chart.legend().setLabelColor(QColor("#dcdcdc"))
@@ -337,10 +346,8 @@ class AnalyticsPanel(QWidget):
 
         self.hour_chart.setChart(chart)
 
-    def update_details_table(self):
+    def update_details_table(self, usage: Dict[str, ModelUsage]):
         """Update the model details table."""
-        usage = self.analytics_manager.get_model_usage()
-
         self.details_table.setRowCount(len(usage))
 
         for i, (model, data) in enumerate(usage.items()):
@@ -277,7 +277,7 @@ class ClaudeMdPanel(QWidget):
 
     def _do_scan(self):
         """Perform the file scan."""
-        files = self.claudemd_manager.find_claude_md_files()
+        files = self.claudemd_manager.find_claude_md_files(force_refresh=True)
 
         for file_info in files:
             item = QListWidgetItem(f"{file_info['project']} / {file_info['name']}")
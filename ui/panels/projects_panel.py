@@ -172,8 +172,8 @@ class ProjectsPanel(QWidget):
         # Populate recent sessions
         recent = self.session_manager.get_recent_sessions(limit=10)
         for item in recent:
-            session = item['session']
-            project = item['project']
+            session = item.session
+            project = item.project
             list_item = QListWidgetItem(f"{project.name}: {session.summary[:40]}...")
             list_item.setData(Qt.UserRole, (project, session))
             list_item.setToolTip(f"Modified: {session.modified}")
@@ -191,8 +191,8 @@ class ProjectsPanel(QWidget):
         self.project_tree.clear()
 
         for result in results:
-            project = result['project']
-            session = result['session']
+            project = result.project
+            session = result.session
 
             item = QTreeWidgetItem([
                 f"{project.name}: {session.summary[:50]}..."
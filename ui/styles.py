@@ -0,0 +1,42 @@
+"""
+Widget-scoped stylesheets for Claude Code Manager.
+
+The application stylesheet only covers widgets used throughout the app. The
+sheets here are set on the few widgets (or their containers) that need them,
+so Qt doesn't match their rules against every widget it polishes.
+"""
+
+import re
+
+
+def minify_stylesheet(sheet: str) -> str:
+    """Strip comments and redundant whitespace from a Qt stylesheet."""
+    sheet = re.sub(r'/\*.*?\*/', '', sheet, flags=re.DOTALL)
+    sheet = re.sub(r'\s+', ' ', sheet)
+    return re.sub(r'\s*([{};,])\s*', r'\1', sheet).strip()
+
+
+CHECKBOX_QSS = minify_stylesheet("""
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border-radius: 3px;
+        border: 1px solid #3d3d3d;
+        background-color: #3c3c3c;
+    }
+
+    QCheckBox::indicator:checked {
+        background-color: #0e639c;
+        border-color: #0e639c;
+    }
+""")
+
+SPINBOX_QSS = minify_stylesheet("""
+    QSpinBox, QDoubleSpinBox {
+        background-color: #3c3c3c;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px;
+        color: #dcdcdc;
+    }
+""")